@@ -14,17 +14,34 @@ Kullanım:
     python aruco_mesafe_olcumu.py
     
 Tuşlar:
-    's' - Mevcut ölçümü Excel'e kaydet
-    'r' - Kayıtları sıfırla
+    's' - Son ~0.5 s (15 frame) içindeki en kaliteli ölçümü Excel'e kaydet
+    'k' - Frame kaydını başlat/durdur (tekrar oynatma için)
+    'r' - Kaydedilmemiş ölçümleri sil (açık Excel dosyası kaydedilmeden atılır)
     'q' - Çıkış
 """
 
 import cv2
 import numpy as np
-import pandas as pd
 from datetime import datetime
 import os
-import math
+import time
+from collections import deque
+
+from esik_alarmlari import GeriCagirmaHedefi, kurallari_yukle
+from excel_akis_yazici import ExcelAkisYazici
+from hizlandirma import arka_uc_sec, opencv_ayarla, umat_ile_tespit
+from kare_tampon_havuzu import KareTamponHavuzu, gri_tampona_cevir
+from kayit_oynatma import KayitYazici
+from referans_tahta import VARSAYILAN_TAHTA, tahta_olcegi_hesapla, tahta_olustur
+from tespit_kalitesi import EnIyiOlcumSecici, kalite_puanlari
+
+
+# Tekrar oynatma kayıtlarına yazılan ve oradan geri yüklenen dedektör parametreleri
+DEDEKTOR_AYARLARI = (
+    "adaptiveThreshWinSizeMin",
+    "adaptiveThreshWinSizeMax",
+    "adaptiveThreshWinSizeStep",
+)
 
 
 class ArucoMesafeOlcucu:
@@ -38,7 +55,8 @@ class ArucoMesafeOlcucu:
     4. Sonuçları Excel'e kaydeder
     """
     
-    def __init__(self, marker_boyutu_cm=5.0):
+    def __init__(self, marker_boyutu_cm=5.0, referans_tahta=None, kalite_esigi=0.5,
+                 sozluk="DICT_4X4_250", dedektor_ayarlari=None):
         """
         ArucoMesafeOlcucu sınıfını başlatır.
         
@@ -47,12 +65,26 @@ class ArucoMesafeOlcucu:
         marker_boyutu_cm : float
             Kullanılan ArUco marker'ın kenar uzunluğu (cm)
             Bu değer piksel-cm dönüşümü için kritik öneme sahiptir.
+        referans_tahta : dict veya None
+            Verilirse piksel/cm oranı bu GridBoard'dan hesaplanır
+            (anahtarlar: sutun, satir, marker_boyutu_cm, bosluk_cm, ilk_id).
+            Tahta görünmediğinde ilk ölçüm marker'ı kullanılır.
+        kalite_esigi : float
+            Kalite puanı (0-1) bu değerin altındaki markerlar ölçüme katılmaz
+            (bulanık, çok eğik veya çok küçük tespitler)
+        sozluk : str
+            cv2.aruco sözlük adı (ör. "DICT_4X4_250")
+        dedektor_ayarlari : dict veya None
+            Varsayılanların üzerine yazılacak DetectorParameters alanları
+            (tekrar oynatmada kayıttaki ayarlar buradan verilir)
         """
         self.marker_boyutu_cm = marker_boyutu_cm
+        self.kalite_esigi = kalite_esigi
         
         # ArUco sözlüğünü ve dedektörü oluştur
         # DICT_4X4_250: 4x4 grid yapısında, 250 benzersiz marker içerir
-        self.aruco_dict = cv2.aruco.getPredefinedDictionary(cv2.aruco.DICT_4X4_250)
+        self.sozluk = sozluk
+        self.aruco_dict = cv2.aruco.getPredefinedDictionary(getattr(cv2.aruco, sozluk))
         
         # Dedektör parametrelerini ayarla
         self.detector_params = cv2.aruco.DetectorParameters()
@@ -60,12 +92,22 @@ class ArucoMesafeOlcucu:
         self.detector_params.adaptiveThreshWinSizeMin = 3
         self.detector_params.adaptiveThreshWinSizeMax = 23
         self.detector_params.adaptiveThreshWinSizeStep = 10
+        for ad, deger in (dedektor_ayarlari or {}).items():
+            setattr(self.detector_params, ad, deger)
         
         # ArUco dedektörünü oluştur
         self.detector = cv2.aruco.ArucoDetector(self.aruco_dict, self.detector_params)
         
-        # Ölçüm kayıtları için liste
-        self.olcum_kayitlari = []
+        # Referans tahta (isteğe bağlı ölçek kaynağı)
+        self.referans_tahta_ayarlari = referans_tahta
+        self.referans_tahta = None
+        self.tahta_idleri = np.empty(0, dtype=np.int32)
+        if referans_tahta is not None:
+            self.referans_tahta = tahta_olustur(self.aruco_dict, **referans_tahta)
+            self.tahta_idleri = self.referans_tahta.getIds().reshape(-1)
+        
+        # Bu seride kaydedilen ölçüm sayısı (satırlar bellekte tutulmaz)
+        self.kayit_sayisi = 0
         
         # Excel dosya yolu
         self.excel_dosyasi = os.path.join(
@@ -73,12 +115,125 @@ class ArucoMesafeOlcucu:
             "aruco_mesafe_olcumleri.xlsx"
         )
         
+        # Akışlı Excel yazıcısı (excel_ac ile veya ilk kayıtta oluşturulur)
+        self.excel_yazici = None
+        
         # Piksel/cm oranı (her frame'de güncellenir)
         self.piksel_cm_orani = None
         
+        # Gri tonlama için tekrar kullanılan tampon (her frame'de yeni ayırma yapılmaz)
+        self.gri_tampon = None
+        
+        # Son ölçüm sonucu (olcum_ciz tekrar tespit yapmadan kullanır)
+        self.son_olcum = None
+        
+        # Yakalamadan sonuca kadar geçen süreler (ms), son 300 frame
+        self.gecikmeler = deque(maxlen=300)
+        
+        # Ön işleme/tespit yolu: "numpy" (varsayılan) veya "umat" (OpenCV T-API)
+        self.arka_uc = "numpy"
+    
+    def hizlandirma_sec(self, ornek_frame):
+        """
+        Kısa bir ölçümle bu makinedeki en hızlı ön işleme yolunu
+        (numpy / UMat) ve iş parçacığı sayısını seçer.
+        
+        Parametreler:
+        -------------
+        ornek_frame : numpy.ndarray
+            Kameradan alınmış örnek BGR frame
+            
+        Döndürür:
+        ---------
+        dict
+            `hizlandirma.arka_uc_sec()` sonucu
+        """
+        secim = arka_uc_sec(self.detector, ornek_frame)
+        self.arka_uc = secim["arka_uc"]
+        
+        for (arka_uc, is_parcacigi), sure in sorted(secim["sureler_ms"].items()):
+            print(f"  {arka_uc:5s} / {is_parcacigi:2d} iş parçacığı: {sure:.2f} ms")
+        print(f"✓ Seçilen yol: {self.arka_uc}, {secim['is_parcacigi_sayisi']} iş parçacığı")
+        return secim
+    
+    def yapilandirma(self):
+        """
+        Ölçücüyü yeniden kurmak için gereken ayarları döndürür.
+        Tekrar oynatma kayıtlarının başlığına yazılır.
+        
+        Döndürür:
+        ---------
+        dict
+            Marker boyutu, sözlük ve dedektör parametreleri
+        """
+        yapilandirma = {
+            "marker_boyutu_cm": self.marker_boyutu_cm,
+            "sozluk": self.sozluk,
+            "referans_tahta": self.referans_tahta_ayarlari,
+            "kalite_esigi": self.kalite_esigi,
+        }
+        for ad in DEDEKTOR_AYARLARI:
+            yapilandirma[ad] = getattr(self.detector_params, ad)
+        return yapilandirma
+    
+    def merkezleri_hesapla(self, koseler):
+        """
+        Markerların merkezlerini vektörel olarak hesaplar (4 köşenin ortalaması).
+        
+        Parametreler:
+        -------------
+        koseler : numpy.ndarray
+            (N, 4, 2) marker köşeleri
+            
+        Döndürür:
+        ---------
+        numpy.ndarray
+            (N, 2) merkez koordinatları
+        """
+        return koseler.mean(axis=1)
+    
+    def kenar_uzunluklari_hesapla(self, koseler):
+        """
+        Markerların piksel cinsinden ortalama kenar uzunluğunu vektörel olarak hesaplar.
+        Perspektif bozulmasını hesaba katmak için 4 kenarın ortalaması alınır.
+        
+        Parametreler:
+        -------------
+        koseler : numpy.ndarray
+            (N, 4, 2) marker köşeleri
+            
+        Döndürür:
+        ---------
+        numpy.ndarray
+            (N,) ortalama kenar uzunlukları
+        """
+        # 4 kenarın uzunluğu: her köşe ile bir sonraki köşe arası
+        kenarlar = np.linalg.norm(koseler - np.roll(koseler, -1, axis=1), axis=2)
+        return kenarlar.mean(axis=1)
+    
+    def mesafe_matrisi_hesapla(self, merkezler, piksel_cm_orani):
+        """
+        Tüm merkez çiftleri arasındaki Öklid mesafelerini cm cinsinden hesaplar.
+        
+        Parametreler:
+        -------------
+        merkezler : numpy.ndarray
+            (N, 2) merkez koordinatları
+        piksel_cm_orani : float
+            Piksel/cm oranı (1.0 verilirse sonuç piksel cinsindendir)
+            
+        Döndürür:
+        ---------
+        numpy.ndarray
+            (N, N) mesafe matrisi
+        """
+        farklar = merkezler[:, None, :] - merkezler[None, :, :]
+        return np.linalg.norm(farklar, axis=2) / piksel_cm_orani
+    
     def marker_merkezi_bul(self, koseleler):
         """
         Marker'ın köşe noktalarından merkez noktasını hesaplar.
+        `merkezleri_hesapla()` üzerinde tek marker için ince bir sarmalayıcıdır.
         
         Parametreler:
         -------------
@@ -90,15 +245,13 @@ class ArucoMesafeOlcucu:
         tuple
             (merkez_x, merkez_y) koordinatları
         """
-        # 4 köşenin ortalaması merkezi verir
-        merkez_x = int(np.mean(koseleler[:, 0]))
-        merkez_y = int(np.mean(koseleler[:, 1]))
-        return (merkez_x, merkez_y)
+        merkez = self.merkezleri_hesapla(np.asarray(koseleler, dtype=np.float32).reshape(1, 4, 2))[0]
+        return (int(merkez[0]), int(merkez[1]))
     
     def marker_boyutu_piksel_hesapla(self, koseleler):
         """
         Marker'ın piksel cinsinden boyutunu hesaplar.
-        Perspektif bozulmasını hesaba katmak için 4 kenarın ortalamasını alır.
+        `kenar_uzunluklari_hesapla()` üzerinde tek marker için ince bir sarmalayıcıdır.
         
         Parametreler:
         -------------
@@ -110,14 +263,8 @@ class ArucoMesafeOlcucu:
         float
             Marker'ın piksel cinsinden ortalama kenar uzunluğu
         """
-        # 4 kenarın uzunluklarını hesapla
-        kenar1 = np.linalg.norm(koseleler[0] - koseleler[1])
-        kenar2 = np.linalg.norm(koseleler[1] - koseleler[2])
-        kenar3 = np.linalg.norm(koseleler[2] - koseleler[3])
-        kenar4 = np.linalg.norm(koseleler[3] - koseleler[0])
-        
-        # Ortalama kenar uzunluğu
-        return (kenar1 + kenar2 + kenar3 + kenar4) / 4
+        koseler = np.asarray(koseleler, dtype=np.float32).reshape(1, 4, 2)
+        return float(self.kenar_uzunluklari_hesapla(koseler)[0])
     
     def piksel_cm_orani_guncelle(self, koseleler):
         """
@@ -146,7 +293,8 @@ class ArucoMesafeOlcucu:
         float
             Piksel cinsinden mesafe
         """
-        return math.sqrt((nokta2[0] - nokta1[0])**2 + (nokta2[1] - nokta1[1])**2)
+        noktalar = np.array([nokta1, nokta2], dtype=np.float64)
+        return float(self.mesafe_matrisi_hesapla(noktalar, 1.0)[0, 1])
     
     def mesafe_cm_hesapla(self, merkez1, merkez2):
         """
@@ -164,103 +312,321 @@ class ArucoMesafeOlcucu:
         """
         if self.piksel_cm_orani is None:
             return None
+        
+        merkezler = np.array([merkez1, merkez2], dtype=np.float64)
+        return float(self.mesafe_matrisi_hesapla(merkezler, self.piksel_cm_orani)[0, 1])
+    
+    def olcum_yap(self, frame, yakalama_zamani=None):
+        """
+        Ölçüm çekirdeği: marker tespiti ve mesafe hesabı yapar, frame'e çizim yapmaz.
+        Sadece sayısal sonuç gereken entegrasyonlar ve toplu işler bu metodu
+        doğrudan kullanabilir; görselleştirme için `olcum_ciz()` ayrıca çağrılır.
+        
+        Parametreler:
+        -------------
+        frame : numpy.ndarray
+            BGR formatında frame veya tek kanallı gri görüntü
+        yakalama_zamani : dict veya None
+            `yakalama_zamani_al()` çıktısı; verilirse gecikme hesaplanır
             
-        piksel_mesafe = self.iki_nokta_arasi_mesafe(merkez1, merkez2)
-        cm_mesafe = piksel_mesafe / self.piksel_cm_orani
-        return cm_mesafe
+        Döndürür:
+        ---------
+        dict
+            idler            : (N,) int32 marker ID'leri
+            koseler          : (N, 4, 2) float32 köşe koordinatları
+            merkezler        : (N, 2) float32 marker merkezleri
+            kenar_px         : (N,) her marker'ın ortalama kenar uzunluğu (piksel)
+            piksel_cm_orani  : Tahtadan veya ilk marker'dan hesaplanan oran, yoksa None
+            olcek_kaynagi    : "tahta", "marker" veya None
+            tahta_idleri     : (M,) görünen tahta markerlarının ID'leri
+            tahta_koseler    : (M, 4, 2) tahta markerlarının köşeleri
+            tahta_hatasi_px  : Tahta uydurmasının karesel ortalama hatası
+            kaliteler        : (N,) 0-1 arası tespit kalite puanları
+            gecerli          : (N,) kalite eşiğini geçen markerlar
+            mesafe_indeksleri: Mesafesi ölçülen iki marker'ın indeksleri veya None
+            olcum_kalitesi   : Ölçülen iki marker'ın en düşük kalitesi
+            mesafeler_cm     : (N, N) tüm merkez çiftleri arası mesafe (geçersizler NaN), oran yoksa None
+            mesafe_cm        : Geçerli ilk iki marker arası mesafe, yoksa None
+            yakalama_zamani  : Verilen yakalama zamanı
+            gecikme_ms       : Yakalamadan sonuca geçen süre, zaman verilmediyse None
+        """
+        # Tahta iyileştirmesi için kullanılacak görüntü
+        tespit_goruntusu = frame
+        
+        if self.arka_uc == "umat":
+            try:
+                koseler, idler, reddedilenler = umat_ile_tespit(self.detector, frame)
+            except cv2.error as hata:
+                # OpenCL sürücüsü çalışma anında hata verirse kalıcı olarak numpy yoluna dön
+                print(f"⚠ UMat yolu başarısız, numpy yoluna geçiliyor: {hata}")
+                self.arka_uc = "numpy"
+                opencv_ayarla("numpy")
+        
+        if self.arka_uc == "numpy":
+            # Gri tonlamaya çevir (ArUco tespiti için gerekli)
+            # Sonuç her seferinde aynı tampona yazılır
+            if frame.ndim == 2:
+                gri = frame
+            else:
+                gri = gri_tampona_cevir(frame, self.gri_tampon)
+                self.gri_tampon = gri
+            
+            # Markerları tespit et
+            koseler, idler, reddedilenler = self.detector.detectMarkers(gri)
+            tespit_goruntusu = gri
+        
+        # Tahta geometrisi bilindiği için, reddedilen adaylardan kaçırılan
+        # tahta markerları geri kazanılır
+        if self.referans_tahta is not None and idler is not None and len(idler) > 0:
+            koseler, idler, reddedilenler, _ = self.detector.refineDetectedMarkers(
+                tespit_goruntusu, self.referans_tahta, koseler, idler, reddedilenler
+            )
+        
+        sonuc = self.tespitten_olcum(koseler, idler, tespit_goruntusu)
+        
+        # Yakalamadan sonuca kadar geçen süre (monotonik saat ile)
+        sonuc["yakalama_zamani"] = yakalama_zamani
+        sonuc["gecikme_ms"] = None
+        if yakalama_zamani is not None:
+            sonuc["gecikme_ms"] = (time.monotonic_ns() - yakalama_zamani["monotonik_ns"]) / 1e6
+            self.gecikmeler.append(sonuc["gecikme_ms"])
+        
+        # Son sonuç saklanır; çizim katmanı tekrar tespit yapmadan kullanabilir
+        self.son_olcum = sonuc
+        return sonuc
     
-    def frame_isle(self, frame):
+    def tespitten_olcum(self, koseler, idler, goruntu=None):
+        """
+        detectMarkers çıktısından vektörel olarak merkez, ölçek ve mesafeleri hesaplar.
+        Referans tahta tanımlıysa tahta markerları ölçüm markerlarından ayrılır
+        ve ölçek tahtadaki tüm köşelerden hesaplanır. Kalite puanı eşiğin
+        altında kalan markerlar ölçek ve mesafe hesabına katılmaz.
+        
+        Parametreler:
+        -------------
+        koseler : tuple
+            detectMarkers köşe çıktısı, her eleman (1, 4, 2)
+        idler : numpy.ndarray veya None
+            detectMarkers ID çıktısı
+        goruntu : numpy.ndarray veya None
+            Netlik puanı için görüntü; None ise netlik hesaba katılmaz
+            
+        Döndürür:
+        ---------
+        dict
+            `olcum_yap()` ile aynı yapı
+        """
+        if idler is None or len(idler) == 0:
+            idler = np.empty(0, dtype=np.int32)
+            koseler = np.empty((0, 4, 2), dtype=np.float32)
+        
+        # OpenCV sürümüne göre ID'ler (N, 1) veya (N,) gelebilir
+        idler = np.asarray(idler, dtype=np.int32).reshape(-1)
+        koseler = np.asarray(koseler, dtype=np.float32).reshape(-1, 4, 2)
+        
+        # Tahta markerlarını ölçüm markerlarından ayır
+        tahta_maskesi = np.isin(idler, self.tahta_idleri)
+        tahta_idleri = idler[tahta_maskesi]
+        tahta_koseler = koseler[tahta_maskesi]
+        idler = idler[~tahta_maskesi]
+        koseler = koseler[~tahta_maskesi]
+        
+        merkezler = self.merkezleri_hesapla(koseler)
+        kenar_px = self.kenar_uzunluklari_hesapla(koseler)
+        
+        # Kalite puanı ve eşik kontrolü
+        kaliteler = kalite_puanlari(koseler, goruntu)
+        gecerli = kaliteler >= self.kalite_esigi
+        gecerli_indeksler = np.flatnonzero(gecerli)
+        
+        # Ölçek: önce tahta (tüm köşelerle en küçük kareler), yoksa ilk marker
+        tahta_orani, tahta_hatasi_px, _ = tahta_olcegi_hesapla(
+            self.referans_tahta, tahta_koseler, tahta_idleri
+        ) if self.referans_tahta is not None else (None, None, 0)
+        
+        if tahta_orani is not None:
+            piksel_cm_orani = tahta_orani
+            olcek_kaynagi = "tahta"
+        elif len(gecerli_indeksler) > 0:
+            piksel_cm_orani = float(kenar_px[gecerli_indeksler[0]]) / self.marker_boyutu_cm
+            olcek_kaynagi = "marker"
+        else:
+            piksel_cm_orani = None
+            olcek_kaynagi = None
+        
+        mesafeler_cm = None
+        mesafe_cm = None
+        mesafe_indeksleri = None
+        olcum_kalitesi = None
+        if piksel_cm_orani is not None:
+            self.piksel_cm_orani = piksel_cm_orani
+            
+            # Tüm merkez çiftleri arası mesafe matrisi
+            mesafeler_cm = self.mesafe_matrisi_hesapla(merkezler, piksel_cm_orani)
+            
+            # Kalitesiz markerların satır/sütunları geçersiz
+            mesafeler_cm[~gecerli, :] = np.nan
+            mesafeler_cm[:, ~gecerli] = np.nan
+            
+            # Geçerli ilk iki marker arasındaki mesafe
+            if len(gecerli_indeksler) >= 2:
+                i, j = gecerli_indeksler[:2]
+                mesafe_indeksleri = (int(i), int(j))
+                mesafe_cm = float(mesafeler_cm[i, j])
+                olcum_kalitesi = float(min(kaliteler[i], kaliteler[j]))
+        
+        return {
+            "idler": idler,
+            "koseler": koseler,
+            "merkezler": merkezler,
+            "kenar_px": kenar_px,
+            "piksel_cm_orani": piksel_cm_orani,
+            "olcek_kaynagi": olcek_kaynagi,
+            "tahta_idleri": tahta_idleri,
+            "tahta_koseler": tahta_koseler,
+            "tahta_hatasi_px": tahta_hatasi_px,
+            "kaliteler": kaliteler,
+            "gecerli": gecerli,
+            "mesafeler_cm": mesafeler_cm,
+            "mesafe_indeksleri": mesafe_indeksleri,
+            "mesafe_cm": mesafe_cm,
+            "olcum_kalitesi": olcum_kalitesi
+        }
+    
+    def olcum_ciz(self, frame, sonuc=None):
+        """
+        Ölçüm sonucunu frame üzerine çizer (marker çerçeveleri, merkezler,
+        ID'ler ve ilk iki marker arası mesafe çizgisi).
+        
+        Parametreler:
+        -------------
+        frame : numpy.ndarray
+            Üzerine çizim yapılacak BGR frame
+        sonuc : dict veya None
+            `olcum_yap()` sonucu, None ise son ölçüm kullanılır
+        """
+        if sonuc is None:
+            sonuc = self.son_olcum
+        if sonuc is None:
+            return
+        
+        # Referans tahta markerlarını farklı renkte çiz
+        if len(sonuc["tahta_idleri"]) > 0:
+            cv2.aruco.drawDetectedMarkers(frame, list(sonuc["tahta_koseler"][:, None]),
+                                          sonuc["tahta_idleri"].reshape(-1, 1), (255, 255, 0))
+        
+        if len(sonuc["idler"]) == 0:
+            return
+        
+        # Tespit edilen markerları çiz
+        cv2.aruco.drawDetectedMarkers(frame, list(sonuc["koseler"][:, None]),
+                                      sonuc["idler"].reshape(-1, 1))
+        
+        merkezler = [(int(x), int(y)) for x, y in sonuc["merkezler"]]
+        
+        for merkez, id_num, gecerli in zip(merkezler, sonuc["idler"], sonuc["gecerli"]):
+            # Merkez noktasını çiz (kalite eşiğini geçemeyenler kırmızı)
+            cv2.circle(frame, merkez, 7, (0, 255, 0) if gecerli else (0, 0, 255), -1)
+            
+            # Marker ID'sini yaz
+            cv2.putText(frame, f"ID: {id_num}", 
+                       (merkez[0] - 20, merkez[1] - 20),
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 0, 0), 2)
+        
+        mesafe_cm = sonuc["mesafe_cm"]
+        if mesafe_cm is not None:
+            i, j = sonuc["mesafe_indeksleri"]
+            merkez1, merkez2 = merkezler[i], merkezler[j]
+            
+            # İki merkez arasına çizgi çiz
+            cv2.line(frame, merkez1, merkez2, (0, 0, 255), 3)
+            
+            # Mesafeyi çizginin ortasına yaz
+            orta_x = (merkez1[0] + merkez2[0]) // 2
+            orta_y = (merkez1[1] + merkez2[1]) // 2
+            
+            mesafe_text = f"{mesafe_cm:.2f} cm"
+            
+            # Arka plan dikdörtgeni
+            (text_w, text_h), _ = cv2.getTextSize(mesafe_text, 
+                                                  cv2.FONT_HERSHEY_SIMPLEX, 
+                                                  1, 2)
+            cv2.rectangle(frame, 
+                         (orta_x - text_w//2 - 10, orta_y - text_h - 10),
+                         (orta_x + text_w//2 + 10, orta_y + 10),
+                         (255, 255, 255), -1)
+            
+            cv2.putText(frame, mesafe_text,
+                       (orta_x - text_w//2, orta_y),
+                       cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 255), 2)
+    
+    def gecikme_ozeti(self):
+        """
+        Son frame'lerin yakalama-sonuç gecikme istatistiklerini döndürür.
+        
+        Döndürür:
+        ---------
+        dict veya None
+            {"ortalama_ms", "medyan_ms", "p95_ms", "en_buyuk_ms", "frame_sayisi"},
+            gecikme ölçülmediyse None
+        """
+        if not self.gecikmeler:
+            return None
+        
+        gecikmeler = np.fromiter(self.gecikmeler, dtype=np.float64)
+        return {
+            "ortalama_ms": float(gecikmeler.mean()),
+            "medyan_ms": float(np.median(gecikmeler)),
+            "p95_ms": float(np.percentile(gecikmeler, 95)),
+            "en_buyuk_ms": float(gecikmeler.max()),
+            "frame_sayisi": len(gecikmeler)
+        }
+    
+    def frame_isle(self, frame, yakalama_zamani=None, olcum_sonrasi=None):
         """
         Bir video frame'ini işleyerek marker tespiti ve mesafe ölçümü yapar.
+        Ölçüm `olcum_yap()` ile, çizim `olcum_ciz()` ile yapılır.
         
         Parametreler:
         -------------
         frame : numpy.ndarray
             BGR formatında video frame'i
+        yakalama_zamani : dict veya None
+            Frame'in yakalama zamanı (`KareTamponHavuzu.zamanli_oku()`)
+        olcum_sonrasi : callable veya None
+            Ölçümden hemen sonra, çizimden önce `olcum_sonrasi(sonuc)` olarak
+            çağrılır (ör. eşik alarmları çizim süresini beklemesin diye)
             
         Döndürür:
         ---------
         tuple
             (işlenmiş_frame, mesafe_cm, tespit_bilgisi)
         """
-        # Gri tonlamaya çevir (ArUco tespiti için gerekli)
-        gri = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        sonuc = self.olcum_yap(frame, yakalama_zamani)
         
-        # Markerları tespit et
-        koseler, idler, reddedilenler = self.detector.detectMarkers(gri)
+        if olcum_sonrasi is not None:
+            olcum_sonrasi(sonuc)
         
         tespit_bilgisi = {
-            "marker_sayisi": 0,
-            "marker_idleri": [],
-            "merkezler": []
+            "marker_sayisi": len(sonuc["idler"]),
+            "marker_idleri": sonuc["idler"].tolist(),
+            "merkezler": [(int(x), int(y)) for x, y in sonuc["merkezler"]],
+            "koseler": list(sonuc["koseler"]),
+            "olcek_kaynagi": sonuc["olcek_kaynagi"],
+            "gecerli_marker_sayisi": int(np.count_nonzero(sonuc["gecerli"])),
+            "olcum_kalitesi": sonuc["olcum_kalitesi"],
+            "olculen_idler": ([int(sonuc["idler"][i]) for i in sonuc["mesafe_indeksleri"]]
+                              if sonuc["mesafe_indeksleri"] is not None else []),
+            "yakalama_zamani": yakalama_zamani,
+            "gecikme_ms": sonuc["gecikme_ms"]
         }
         
-        mesafe_cm = None
-        
-        if idler is not None and len(idler) > 0:
-            tespit_bilgisi["marker_sayisi"] = len(idler)
-            tespit_bilgisi["marker_idleri"] = idler.flatten().tolist()
-            
-            # Tespit edilen markerları çiz
-            cv2.aruco.drawDetectedMarkers(frame, koseler, idler)
-            
-            merkezler = []
-            
-            for i, (kose, id_num) in enumerate(zip(koseler, idler)):
-                kose = kose[0]  # (1, 4, 2) -> (4, 2)
-                
-                # İlk marker ile piksel/cm oranını güncelle
-                if i == 0:
-                    self.piksel_cm_orani_guncelle(kose)
-                
-                # Merkez noktasını bul
-                merkez = self.marker_merkezi_bul(kose)
-                merkezler.append((id_num[0], merkez))
-                tespit_bilgisi["merkezler"].append(merkez)
-                
-                # Merkez noktasını çiz
-                cv2.circle(frame, merkez, 7, (0, 255, 0), -1)
-                
-                # Marker ID'sini yaz
-                cv2.putText(frame, f"ID: {id_num[0]}", 
-                           (merkez[0] - 20, merkez[1] - 20),
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 0, 0), 2)
-            
-            # En az 2 marker varsa mesafe hesapla
-            if len(merkezler) >= 2:
-                # İlk iki marker arasındaki mesafeyi hesapla
-                id1, merkez1 = merkezler[0]
-                id2, merkez2 = merkezler[1]
-                
-                mesafe_cm = self.mesafe_cm_hesapla(merkez1, merkez2)
-                
-                if mesafe_cm is not None:
-                    # İki merkez arasına çizgi çiz
-                    cv2.line(frame, merkez1, merkez2, (0, 0, 255), 3)
-                    
-                    # Mesafeyi çizginin ortasına yaz
-                    orta_x = (merkez1[0] + merkez2[0]) // 2
-                    orta_y = (merkez1[1] + merkez2[1]) // 2
-                    
-                    mesafe_text = f"{mesafe_cm:.2f} cm"
-                    
-                    # Arka plan dikdörtgeni
-                    (text_w, text_h), _ = cv2.getTextSize(mesafe_text, 
-                                                          cv2.FONT_HERSHEY_SIMPLEX, 
-                                                          1, 2)
-                    cv2.rectangle(frame, 
-                                 (orta_x - text_w//2 - 10, orta_y - text_h - 10),
-                                 (orta_x + text_w//2 + 10, orta_y + 10),
-                                 (255, 255, 255), -1)
-                    
-                    cv2.putText(frame, mesafe_text,
-                               (orta_x - text_w//2, orta_y),
-                               cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 255), 2)
+        self.olcum_ciz(frame, sonuc)
         
         # Bilgi paneli ekle
-        self.bilgi_paneli_ekle(frame, tespit_bilgisi, mesafe_cm)
+        self.bilgi_paneli_ekle(frame, tespit_bilgisi, sonuc["mesafe_cm"])
         
-        return frame, mesafe_cm, tespit_bilgisi
+        return frame, sonuc["mesafe_cm"], tespit_bilgisi
     
     def bilgi_paneli_ekle(self, frame, tespit_bilgisi, mesafe_cm):
         """
@@ -276,9 +642,10 @@ class ArucoMesafeOlcucu:
             Ölçülen mesafe
         """
         # Yarı saydam arka plan
-        overlay = frame.copy()
-        cv2.rectangle(overlay, (10, 10), (350, 150), (0, 0, 0), -1)
-        cv2.addWeighted(overlay, 0.7, frame, 0.3, 0, frame)
+        # Siyah dikdörtgenle %70 karıştırmak, bölgeyi 0.3 ile çarpmakla aynıdır.
+        # Tüm frame'in kopyası yerine yalnızca panel bölgesi (view) yerinde işlenir.
+        panel = frame[10:176, 10:351]
+        cv2.addWeighted(panel, 0.3, panel, 0, 0, panel)
         
         # Bilgileri yaz
         y = 35
@@ -286,28 +653,44 @@ class ArucoMesafeOlcucu:
                    (20, y), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 1)
         
         y += 25
-        cv2.putText(frame, f"Tespit: {tespit_bilgisi['marker_sayisi']} marker", 
+        olcek_notu = " (olcek: tahta)" if tespit_bilgisi.get("olcek_kaynagi") == "tahta" else ""
+        cv2.putText(frame, f"Tespit: {tespit_bilgisi['marker_sayisi']} marker{olcek_notu}", 
                    (20, y), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 1)
         
         y += 25
         if mesafe_cm is not None:
-            cv2.putText(frame, f"Mesafe: {mesafe_cm:.2f} cm", 
+            kalite = tespit_bilgisi.get("olcum_kalitesi")
+            kalite_notu = f" (Q {kalite:.2f})" if kalite is not None else ""
+            cv2.putText(frame, f"Mesafe: {mesafe_cm:.2f} cm{kalite_notu}", 
                        (20, y), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 0), 1)
+        elif tespit_bilgisi["marker_sayisi"] >= 2:
+            cv2.putText(frame, "Mesafe: kalite dusuk", 
+                       (20, y), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 165, 255), 1)
         else:
             cv2.putText(frame, "Mesafe: 2 marker gerekli", 
                        (20, y), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 255), 1)
         
         y += 25
-        cv2.putText(frame, f"Kayit Sayisi: {len(self.olcum_kayitlari)}", 
+        cv2.putText(frame, f"Kayit Sayisi: {self.kayit_sayisi}", 
                    (20, y), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 1)
         
         y += 25
-        cv2.putText(frame, "'s':Kaydet 'r':Sifirla 'q':Cikis", 
+        if tespit_bilgisi.get("gecikme_ms") is not None:
+            cv2.putText(frame, f"Gecikme: {tespit_bilgisi['gecikme_ms']:.1f} ms", 
+                       (20, y), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 1)
+        else:
+            cv2.putText(frame, "Gecikme: -", 
+                       (20, y), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (200, 200, 200), 1)
+        
+        y += 25
+        cv2.putText(frame, "'s':Kaydet 'r':Sifirla 'k':Kayit 'q':Cikis", 
                    (20, y), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (200, 200, 200), 1)
     
-    def olcum_kaydet(self, mesafe_cm, marker_idleri):
+    def olcum_kaydet(self, mesafe_cm, marker_idleri, yakalama_zamani=None, gecikme_ms=None,
+                     kalite=None, piksel_cm_orani=None):
         """
-        Ölçümü listeye ekler.
+        Ölçümü hemen Excel yazıcısının kuyruğuna verir. Yazma arka planda
+        yapılır; satırlar bellekte biriktirilmez.
         
         Parametreler:
         -------------
@@ -315,51 +698,67 @@ class ArucoMesafeOlcucu:
             Ölçülen mesafe
         marker_idleri : list
             Kullanılan marker ID'leri
+        yakalama_zamani : dict veya None
+            Ölçülen frame'in yakalama zamanı; verilmezse kayıt anı kullanılır
+        gecikme_ms : float veya None
+            Yakalamadan sonuca geçen süre
+        kalite : float veya None
+            Ölçümün tespit kalite puanı (0-1)
+        piksel_cm_orani : float veya None
+            Ölçülen frame'in oranı; verilmezse son hesaplanan oran kullanılır
         """
+        if piksel_cm_orani is None:
+            piksel_cm_orani = self.piksel_cm_orani
+        
+        # Tarih/saat tuşa basılan anı değil, frame'in yakalandığı anı gösterir
+        if yakalama_zamani is not None:
+            zaman_damgasi_ns = yakalama_zamani["zaman_damgasi_ns"]
+        else:
+            zaman_damgasi_ns = time.time_ns()
+        zaman = datetime.fromtimestamp(zaman_damgasi_ns / 1e9)
+        
         kayit = {
-            "tarih": datetime.now().strftime("%Y-%m-%d"),
-            "saat": datetime.now().strftime("%H:%M:%S"),
+            "tarih": zaman.strftime("%Y-%m-%d"),
+            "saat": zaman.strftime("%H:%M:%S"),
+            # Mikrosaniye tamsayı: Excel'in float64 sayılarında kayıpsız saklanır
+            "zaman_damgasi_us": zaman_damgasi_ns // 1000,
             "marker_1_id": marker_idleri[0] if len(marker_idleri) > 0 else None,
             "marker_2_id": marker_idleri[1] if len(marker_idleri) > 1 else None,
             "marker_boyutu_cm": self.marker_boyutu_cm,
             "mesafe_cm": round(mesafe_cm, 2),
-            "piksel_cm_orani": round(self.piksel_cm_orani, 4) if self.piksel_cm_orani else None
+            "piksel_cm_orani": round(piksel_cm_orani, 4) if piksel_cm_orani else None,
+            "kalite": round(kalite, 3) if kalite is not None else None,
+            "gecikme_ms": round(gecikme_ms, 2) if gecikme_ms is not None else None
         }
-        self.olcum_kayitlari.append(kayit)
+        self.excel_ac()
+        self.excel_yazici.ekle([kayit])
+        self.kayit_sayisi += 1
         print(f"✓ Ölçüm kaydedildi: {mesafe_cm:.2f} cm")
         return kayit
     
-    def excel_kaydet(self):
+    def excel_ac(self):
         """
-        Tüm ölçümleri Excel dosyasına kaydeder.
-        Mevcut dosya varsa üzerine ekler.
+        Akışlı Excel yazıcısını başlatır (arka plan iş parçacığı).
+        `main()` program başında çağırır; böylece her ölçüm kaydedildiği anda
+        yazıcıya verilir ve çıkışta sadece son birkaç satır beklenir.
         """
-        if not self.olcum_kayitlari:
-            print("⚠ Kaydedilecek ölçüm yok!")
-            return
-        
-        yeni_df = pd.DataFrame(self.olcum_kayitlari)
-        
-        # Mevcut dosya varsa birleştir
-        if os.path.exists(self.excel_dosyasi):
-            try:
-                mevcut_df = pd.read_excel(self.excel_dosyasi)
-                df = pd.concat([mevcut_df, yeni_df], ignore_index=True)
-            except:
-                df = yeni_df
-        else:
-            df = yeni_df
-        
-        # Excel'e kaydet
-        df.to_excel(self.excel_dosyasi, index=False, engine='openpyxl')
-        print(f"✓ {len(self.olcum_kayitlari)} ölçüm Excel'e kaydedildi: {self.excel_dosyasi}")
-        
-        # Listeyi temizle
-        self.olcum_kayitlari = []
+        if self.excel_yazici is None:
+            self.excel_yazici = ExcelAkisYazici(self.excel_dosyasi)
+    
+    def excel_kapat(self):
+        """Kuyruktaki ölçümlerin yazılmasını bekler ve Excel dosyasını kapatır."""
+        if self.excel_yazici is not None:
+            self.excel_yazici.kapat()
+            self.excel_yazici = None
     
     def kayitlari_sifirla(self):
-        """Kaydedilmemiş ölçümleri siler."""
-        self.olcum_kayitlari = []
+        """
+        Kaydedilmemiş ölçümleri siler. Satırlar yazıcının açık (henüz diske
+        kaydedilmemiş) dosyasındadır; bu dosya kaydedilmeden atılır.
+        """
+        self.kayit_sayisi = 0
+        if self.excel_yazici is not None:
+            self.excel_yazici.kaydedilmemisleri_at()
         print("✓ Kayıtlar sıfırlandı")
 
 
@@ -409,11 +808,27 @@ def main():
     except ValueError:
         boyut = 5.0
     
+    # Referans tahta (isteğe bağlı)
+    referans_tahta = None
+    print("\nReferans tahta kullanılsın mı? (python referans_tahta.py ile oluşturulur)")
+    if input("Referans tahta (e/h) [varsayılan: h]: ").strip().lower() == "e":
+        referans_tahta = dict(VARSAYILAN_TAHTA)
+        try:
+            referans_tahta["marker_boyutu_cm"] = float(
+                input(f"Tahta marker boyutu (cm) [varsayılan: {VARSAYILAN_TAHTA['marker_boyutu_cm']}]: ")
+                or VARSAYILAN_TAHTA["marker_boyutu_cm"])
+            referans_tahta["bosluk_cm"] = float(
+                input(f"Tahta marker boşluğu (cm) [varsayılan: {VARSAYILAN_TAHTA['bosluk_cm']}]: ")
+                or VARSAYILAN_TAHTA["bosluk_cm"])
+        except ValueError:
+            print("Geçersiz değer! Varsayılan tahta ölçüleri kullanılıyor...")
+            referans_tahta = dict(VARSAYILAN_TAHTA)
+    
     # Kamera seç
     kamera_kaynak = kamera_sec()
     
     # Ölçücü oluştur
-    olcucu = ArucoMesafeOlcucu(marker_boyutu_cm=boyut)
+    olcucu = ArucoMesafeOlcucu(marker_boyutu_cm=boyut, referans_tahta=referans_tahta)
     
     # Kamerayı başlat
     print("\nKamera başlatılıyor...")
@@ -430,28 +845,83 @@ def main():
     cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
     
     print("\n✓ Kamera başlatıldı!")
+    
+    # Frame'ler önceden ayrılmış tamponlara okunur
+    havuz = KareTamponHavuzu(tampon_sayisi=2)
+    
+    # İlk frame ile en hızlı ön işleme yolunu seç
+    ret, ornek_frame = havuz.oku(cap)
+    if ret:
+        print("\nHızlandırma yolu seçiliyor...")
+        olcucu.hizlandirma_sec(ornek_frame)
     print("\n--- KONTROLLER ---")
-    print("'s' - Mevcut ölçümü kaydet")
+    print("'s' - Son ~0.5 s içindeki en kaliteli ölçümü kaydet")
     print("'r' - Kayıtları sıfırla")
-    print("'q' - Çıkış (Excel'e kaydeder)")
+    print("'k' - Frame kaydını başlat/durdur")
+    print("'q' - Çıkış")
     print("-" * 30)
     
-    son_mesafe = None
-    son_marker_idleri = []
+    # Mesafe eşik alarmları (esik_kurallari.json varsa)
+    alarm_motoru = None
+    kural_yolu = os.path.join(os.path.dirname(__file__), "esik_kurallari.json")
+    if os.path.exists(kural_yolu):
+        alarm_motoru = kurallari_yukle(kural_yolu, [GeriCagirmaHedefi(
+            lambda olay: print(f"{'⚠' if olay['tip'] == 'ihlal' else '✓'} Alarm [{olay['kural']}] "
+                               f"{olay['tip']}: {olay['mesafe_cm']} cm"))])
+        print(f"✓ {len(alarm_motoru.kurallar)} eşik kuralı yüklendi: {kural_yolu}")
+    
+    # Ölçümler 's' ile kaydedildikleri anda arka planda Excel'e yazılır
+    olcucu.excel_ac()
+    
+    # 's' tuşunda son 15 frame (~0.5 s) içindeki en kaliteli ölçüm kaydedilir
+    secici = EnIyiOlcumSecici(pencere=15)
+    
+    # Tekrar oynatma kaydı ('k' ile açılır)
+    kaydedici = None
+    kayit_baslangici_ns = None
     
     while True:
-        ret, frame = cap.read()
+        # Yakalama zamanı grab() anında alınır ve işlem hattı boyunca taşınır
+        ret, frame, yakalama_zamani = havuz.zamanli_oku(cap)
         if not ret:
             print("Kamera bağlantısı kesildi!")
             break
         
-        # Frame'i işle
-        islenmiş_frame, mesafe_cm, tespit = olcucu.frame_isle(frame)
+        # frame_isle frame üzerine çizim yaptığı için ham hali kayıttan önce saklanır
+        ham_frame = None
+        if kaydedici is not None:
+            ham_frame = frame.copy()
         
-        # Son geçerli ölçümü sakla
+        # Frame'i işle; eşik kuralları mesafe matrisi hesaplanır hesaplanmaz,
+        # marker ve panel çiziminden önce değerlendirilir
+        islenmiş_frame, mesafe_cm, tespit = olcucu.frame_isle(
+            frame, yakalama_zamani,
+            olcum_sonrasi=alarm_motoru.degerlendir if alarm_motoru is not None else None
+        )
+        
+        if kaydedici is not None:
+            zaman_ms = (yakalama_zamani["monotonik_ns"] - kayit_baslangici_ns) / 1e6
+            kaydedici.kare_ekle(ham_frame, zaman_ms, tespit["marker_idleri"], tespit["koseler"])
+        
+        # Aktif alarmları göster
+        if alarm_motoru is not None:
+            aktif = alarm_motoru.aktif_ihlaller()
+            if aktif:
+                cv2.putText(islenmiş_frame, "ALARM: " + ", ".join(aktif),
+                            (20, islenmiş_frame.shape[0] - 20),
+                            cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
+        
+        # Geçerli ölçümü kalite puanıyla pencereye ekle
         if mesafe_cm is not None:
-            son_mesafe = mesafe_cm
-            son_marker_idleri = tespit["marker_idleri"]
+            secici.ekle({
+                "mesafe_cm": mesafe_cm,
+                "marker_idleri": tespit["olculen_idler"],
+                "yakalama_zamani": yakalama_zamani,
+                "gecikme_ms": tespit["gecikme_ms"],
+                "piksel_cm_orani": olcucu.piksel_cm_orani
+            }, tespit["olcum_kalitesi"])
+        else:
+            secici.ekle(None)
         
         # Görüntüyü göster
         cv2.imshow("ArUco Mesafe Olcumu", islenmiş_frame)
@@ -460,13 +930,31 @@ def main():
         key = cv2.waitKey(1) & 0xFF
         
         if key == ord('q'):
-            # Çıkışta Excel'e kaydet
-            olcucu.excel_kaydet()
             break
+        elif key == ord('k'):
+            # Frame kaydını başlat/durdur
+            if kaydedici is None:
+                kayit_yolu = os.path.join(
+                    os.path.dirname(__file__), "kayitlar",
+                    f"aruco_kayit_{datetime.now().strftime('%Y%m%d_%H%M%S')}.amk"
+                )
+                yapilandirma = olcucu.yapilandirma()
+                # Kayıttaki göreli zamanları Unix zamanına çevirebilmek için
+                yapilandirma["kayit_baslangici_ns"] = time.time_ns()
+                kaydedici = KayitYazici(kayit_yolu, yapilandirma)
+                kayit_baslangici_ns = time.monotonic_ns()
+                print(f"● Kayıt başladı: {kayit_yolu}")
+            else:
+                kaydedici.kapat()
+                kaydedici = None
         elif key == ord('s'):
             # Mevcut ölçümü kaydet
-            if son_mesafe is not None:
-                olcucu.olcum_kaydet(son_mesafe, son_marker_idleri)
+            en_iyi = secici.en_iyi()
+            if en_iyi is not None:
+                kalite, olcum = en_iyi
+                olcucu.olcum_kaydet(kalite=kalite, **olcum)
+                # Aynı ölçüm art arda basışlarda tekrar kaydedilmesin
+                secici.temizle()
             else:
                 print("⚠ Kaydedilecek geçerli ölçüm yok!")
         elif key == ord('r'):
@@ -474,8 +962,32 @@ def main():
             olcucu.kayitlari_sifirla()
     
     # Temizlik
+    if kaydedici is not None:
+        kaydedici.kapat()
     cap.release()
     cv2.destroyAllWindows()
+    
+    # Kuyruktaki ölçümlerin ve alarm olaylarının iletilmesini bekle
+    olcucu.excel_kapat()
+    if alarm_motoru is not None:
+        alarm_motoru.kapat()
+    
+    # Gecikme özeti
+    ozet = olcucu.gecikme_ozeti()
+    if ozet is not None:
+        print(f"\nGecikme (son {ozet['frame_sayisi']} frame): "
+              f"ortalama {ozet['ortalama_ms']:.1f} ms, medyan {ozet['medyan_ms']:.1f} ms, "
+              f"p95 {ozet['p95_ms']:.1f} ms, en büyük {ozet['en_buyuk_ms']:.1f} ms")
+    
+    alarm_ozeti = alarm_motoru.gecikme_ozeti() if alarm_motoru is not None else None
+    if alarm_ozeti is not None:
+        print(f"Alarm olayları ({alarm_ozeti['olay_sayisi']} olay, "
+              f"{alarm_ozeti['dusurulen_olay_sayisi']} düşürülen): "
+              f"tetik->teslim medyan {alarm_ozeti['tetik_teslim_medyan_ms']:.2f} ms, "
+              f"p95 {alarm_ozeti['tetik_teslim_p95_ms']:.2f} ms")
+        if "yakalama_teslim_medyan_ms" in alarm_ozeti:
+            print(f"  yakalama->teslim medyan {alarm_ozeti['yakalama_teslim_medyan_ms']:.1f} ms, "
+                  f"p95 {alarm_ozeti['yakalama_teslim_p95_ms']:.1f} ms")
     print("\nProgram sonlandırıldı.")
 
 
@@ -0,0 +1,327 @@
+"""
+Mesafe Eşik Alarmları
+=====================
+Marker çiftleri arasındaki mesafeyi her frame'de kurallara göre kontrol eder
+ve ihlal başladığında/bittiğinde olay üretir.
+
+Her kural bir marker çifti için en küçük ve/veya en büyük mesafe tanımlar:
+- Histerezis: İhlalden çıkmak için mesafenin sınırın histerezis kadar
+  içine dönmesi gerekir (sınırda titreşen alarmları önler)
+- Debounce: Durum değişikliği ancak art arda N frame'de görülürse kabul edilir
+
+Tüm kurallar tek seferde (vektörel) değerlendirilir. Olaylar engellemeyen
+bir kuyruğa konur ve ayrı bir iş parçacığı tarafından hedeflere iletilir:
+- SoketHedefi        : UDP ile JSON satırı (ör. 127.0.0.1:9999)
+- DosyaHedefi        : JSON Lines dosyası
+- GeriCagirmaHedefi  : Python fonksiyonu
+
+Kurallar JSON dosyasından yüklenebilir (esik_kurallari.json):
+    {
+        "kurallar": [
+            {"ad": "kapi", "id1": 1, "id2": 2, "min_cm": 10, "max_cm": 50,
+             "histerezis_cm": 0.5, "debounce_kare": 3}
+        ],
+        "hedefler": [
+            {"tip": "soket", "host": "127.0.0.1", "port": 9999},
+            {"tip": "dosya", "yol": "alarmlar.jsonl"}
+        ]
+    }
+"""
+
+import json
+import os
+import queue
+import socket
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+
+class SoketHedefi:
+    """Olayları UDP üzerinden JSON satırı olarak gönderir."""
+
+    def __init__(self, host="127.0.0.1", port=9999):
+        self.adres = (host, port)
+        self.soket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    def gonder(self, olay):
+        self.soket.sendto(json.dumps(olay).encode("utf-8") + b"\n", self.adres)
+
+    def kapat(self):
+        self.soket.close()
+
+
+class DosyaHedefi:
+    """Olayları JSON Lines dosyasına ekler."""
+
+    def __init__(self, yol):
+        self.dosya = open(yol, "a", encoding="utf-8")
+
+    def gonder(self, olay):
+        self.dosya.write(json.dumps(olay, ensure_ascii=False) + "\n")
+        self.dosya.flush()
+
+    def kapat(self):
+        self.dosya.close()
+
+
+class GeriCagirmaHedefi:
+    """Her olay için verilen fonksiyonu çağırır."""
+
+    def __init__(self, fonksiyon):
+        self.fonksiyon = fonksiyon
+
+    def gonder(self, olay):
+        self.fonksiyon(olay)
+
+    def kapat(self):
+        pass
+
+
+class KuralMotoru:
+    """
+    Mesafe eşik kurallarını vektörel olarak değerlendirir ve olayları
+    arka plan iş parçacığıyla hedeflere iletir.
+    """
+
+    def __init__(self, kurallar, hedefler=(), kuyruk_boyutu=1000):
+        """
+        KuralMotoru sınıfını başlatır ve iletim iş parçacığını çalıştırır.
+
+        Parametreler:
+        -------------
+        kurallar : list
+            Kural sözlükleri: ad, id1, id2, min_cm, max_cm,
+            histerezis_cm (varsayılan 0.5), debounce_kare (varsayılan 3, en az 1).
+            Geçersiz kurallar için ValueError verilir
+        hedefler : list
+            `gonder(olay)` ve `kapat()` metotları olan hedef nesneleri
+        kuyruk_boyutu : int
+            Kuyruk dolarsa yeni olaylar düşürülür (frame döngüsü asla beklemez)
+        """
+        self.kurallar = list(kurallar)
+        self.hedefler = list(hedefler)
+
+        # Kural parametreleri diziler halinde tutulur
+        self.adlar = [k.get("ad", f"{k['id1']}-{k['id2']}") for k in self.kurallar]
+        self.id1 = np.array([k["id1"] for k in self.kurallar], dtype=np.int32)
+        self.id2 = np.array([k["id2"] for k in self.kurallar], dtype=np.int32)
+        self.min_cm = np.array([k.get("min_cm") if k.get("min_cm") is not None else -np.inf
+                                for k in self.kurallar], dtype=np.float64)
+        self.max_cm = np.array([k.get("max_cm") if k.get("max_cm") is not None else np.inf
+                                for k in self.kurallar], dtype=np.float64)
+        self.histerezis_cm = np.array([k.get("histerezis_cm", 0.5) for k in self.kurallar],
+                                      dtype=np.float64)
+        self.debounce_kare = np.array([k.get("debounce_kare", 3) for k in self.kurallar],
+                                      dtype=np.int32)
+
+        # Geçersiz kurallar her frame'de durum değiştirir veya hiç temizlenmez
+        for ad, debounce, en_kucuk, en_buyuk, histerezis in zip(
+                self.adlar, self.debounce_kare, self.min_cm, self.max_cm, self.histerezis_cm):
+            if debounce < 1:
+                raise ValueError(f"Kural '{ad}': debounce_kare en az 1 olmalı ({debounce})")
+            if histerezis < 0:
+                raise ValueError(f"Kural '{ad}': histerezis_cm negatif olamaz ({histerezis})")
+            if en_kucuk + histerezis > en_buyuk - histerezis:
+                raise ValueError(f"Kural '{ad}': min_cm + histerezis_cm, max_cm - histerezis_cm "
+                                 f"değerinden büyük; ihlal hiç temizlenemez")
+
+        # Kural durumları: ihlalde mi, kaç frame'dir durum değişikliği görülüyor
+        self.ihlal = np.zeros(len(self.kurallar), dtype=bool)
+        self.sayac = np.zeros(len(self.kurallar), dtype=np.int32)
+
+        # Gecikme istatistikleri (ms), son 1000 olay
+        self.tetik_teslim_gecikmeleri = deque(maxlen=1000)
+        self.yakalama_teslim_gecikmeleri = deque(maxlen=1000)
+        self.dusurulen_olay_sayisi = 0
+
+        self.kuyruk = queue.Queue(maxsize=kuyruk_boyutu)
+        self.is_parcacigi = threading.Thread(target=self.ilet, name="KuralMotoru", daemon=True)
+        self.is_parcacigi.start()
+
+    def degerlendir(self, sonuc):
+        """
+        Bir frame'in ölçüm sonucunu tüm kurallara karşı değerlendirir.
+
+        Parametreler:
+        -------------
+        sonuc : dict
+            `ArucoMesafeOlcucu.olcum_yap()` sonucu
+
+        Döndürür:
+        ---------
+        list
+            Bu frame'de üretilen olaylar
+        """
+        if not self.kurallar:
+            return []
+
+        idler = sonuc["idler"]
+        mesafeler_cm = sonuc["mesafeler_cm"]
+
+        # Her kuralın marker'larının bu frame'deki indeksleri (R, N) eşleşme ile
+        eslesme1 = self.id1[:, None] == idler[None, :]
+        eslesme2 = self.id2[:, None] == idler[None, :]
+        gorunur = eslesme1.any(axis=1) & eslesme2.any(axis=1)
+
+        mesafe = np.full(len(self.kurallar), np.nan)
+        if mesafeler_cm is not None and gorunur.any():
+            i = eslesme1.argmax(axis=1)[gorunur]
+            j = eslesme2.argmax(axis=1)[gorunur]
+            mesafe[gorunur] = mesafeler_cm[i, j]
+        # Kalite eşiğini geçemeyen markerlar NaN gelir
+        gorunur &= ~np.isnan(mesafe)
+
+        with np.errstate(invalid="ignore"):
+            sinir_disi = (mesafe < self.min_cm) | (mesafe > self.max_cm)
+            sinir_ici = ((mesafe >= self.min_cm + self.histerezis_cm) &
+                         (mesafe <= self.max_cm - self.histerezis_cm))
+
+        # Histerezis: ihlaldeyken çıkmak için histerezis bandının içine dönmek gerekir
+        hedef_durum = np.where(self.ihlal, ~sinir_ici, sinir_disi)
+
+        # Debounce: art arda görülen değişiklikler sayılır, marker kaybolursa sayaç sıfırlanır
+        degisiyor = gorunur & (hedef_durum != self.ihlal)
+        self.sayac = np.where(degisiyor, self.sayac + 1, 0)
+        tetiklenen = np.flatnonzero(self.sayac >= self.debounce_kare)
+
+        if len(tetiklenen) == 0:
+            return []
+
+        self.ihlal[tetiklenen] = ~self.ihlal[tetiklenen]
+        self.sayac[tetiklenen] = 0
+
+        tetik_ns = time.monotonic_ns()
+        yakalama_zamani = sonuc.get("yakalama_zamani")
+
+        olaylar = []
+        for k in tetiklenen:
+            olay = {
+                "tip": "ihlal" if self.ihlal[k] else "normal",
+                "kural": self.adlar[k],
+                "id1": int(self.id1[k]),
+                "id2": int(self.id2[k]),
+                "mesafe_cm": round(float(mesafe[k]), 2),
+                "min_cm": self.kurallar[k].get("min_cm"),
+                "max_cm": self.kurallar[k].get("max_cm"),
+                "zaman_damgasi_ns": (yakalama_zamani["zaman_damgasi_ns"]
+                                     if yakalama_zamani is not None else time.time_ns()),
+                "yakalama_monotonik_ns": (yakalama_zamani["monotonik_ns"]
+                                          if yakalama_zamani is not None else None),
+                "tetik_monotonik_ns": tetik_ns,
+            }
+            try:
+                self.kuyruk.put_nowait(olay)
+            except queue.Full:
+                self.dusurulen_olay_sayisi += 1
+            olaylar.append(olay)
+
+        return olaylar
+
+    def aktif_ihlaller(self):
+        """Şu an ihlal durumunda olan kuralların adlarını döndürür."""
+        return [self.adlar[k] for k in np.flatnonzero(self.ihlal)]
+
+    def ilet(self):
+        """İletim iş parçacığı: kuyruktaki olayları tüm hedeflere gönderir."""
+        while True:
+            olay = self.kuyruk.get()
+            if olay is None:
+                break
+
+            for hedef in self.hedefler:
+                try:
+                    hedef.gonder(olay)
+                except Exception as hata:
+                    print(f"⚠ Alarm hedefi hatası ({type(hedef).__name__}): {hata}")
+
+            teslim_ns = time.monotonic_ns()
+            self.tetik_teslim_gecikmeleri.append((teslim_ns - olay["tetik_monotonik_ns"]) / 1e6)
+            if olay["yakalama_monotonik_ns"] is not None:
+                self.yakalama_teslim_gecikmeleri.append(
+                    (teslim_ns - olay["yakalama_monotonik_ns"]) / 1e6)
+
+    def gecikme_ozeti(self):
+        """
+        Olay gecikme istatistiklerini döndürür.
+
+        Döndürür:
+        ---------
+        dict veya None
+            tetik_teslim_*    : Kuralın tetiklenmesinden hedeflere teslime (ms)
+            yakalama_teslim_* : Frame yakalanmasından hedeflere teslime (ms)
+            Henüz olay yoksa None
+        """
+        if not self.tetik_teslim_gecikmeleri:
+            return None
+
+        ozet = {"olay_sayisi": len(self.tetik_teslim_gecikmeleri),
+                "dusurulen_olay_sayisi": self.dusurulen_olay_sayisi}
+        for ad, gecikmeler in (("tetik_teslim", self.tetik_teslim_gecikmeleri),
+                               ("yakalama_teslim", self.yakalama_teslim_gecikmeleri)):
+            if gecikmeler:
+                dizi = np.fromiter(gecikmeler, dtype=np.float64)
+                ozet[f"{ad}_medyan_ms"] = float(np.median(dizi))
+                ozet[f"{ad}_p95_ms"] = float(np.percentile(dizi, 95))
+                ozet[f"{ad}_en_buyuk_ms"] = float(dizi.max())
+        return ozet
+
+    def kapat(self):
+        """Kuyruktaki olayları iletir, iş parçacığını ve hedefleri kapatır."""
+        if self.is_parcacigi is None:
+            return
+        self.kuyruk.put(None)
+        self.is_parcacigi.join()
+        self.is_parcacigi = None
+
+        for hedef in self.hedefler:
+            hedef.kapat()
+
+
+def hedef_olustur(ayar, temel_klasor=""):
+    """
+    JSON ayarından hedef nesnesi oluşturur.
+
+    Parametreler:
+    -------------
+    ayar : dict
+        {"tip": "soket", "host", "port"} veya {"tip": "dosya", "yol"}
+    temel_klasor : str
+        Göreli dosya yolları bu klasöre göre çözülür
+    """
+    if ayar["tip"] == "soket":
+        return SoketHedefi(ayar.get("host", "127.0.0.1"), ayar.get("port", 9999))
+    if ayar["tip"] == "dosya":
+        return DosyaHedefi(os.path.join(temel_klasor, ayar["yol"]))
+    raise ValueError(f"Bilinmeyen hedef tipi: {ayar['tip']}")
+
+
+def kurallari_yukle(yol, ek_hedefler=()):
+    """
+    Kural dosyasını okuyup bir KuralMotoru oluşturur.
+
+    Parametreler:
+    -------------
+    yol : str
+        JSON kural dosyası
+    ek_hedefler : list
+        Dosyadakilere ek olarak kullanılacak hedefler (ör. GeriCagirmaHedefi)
+
+    Döndürür:
+    ---------
+    KuralMotoru
+    """
+    with open(yol, encoding="utf-8") as dosya:
+        ayarlar = json.load(dosya)
+
+    klasor = os.path.dirname(yol)
+    hedefler = [hedef_olustur(ayar, klasor) for ayar in ayarlar.get("hedefler", [])]
+    try:
+        return KuralMotoru(ayarlar.get("kurallar", []), hedefler + list(ek_hedefler))
+    except ValueError:
+        # Geçersiz kural: açılan soket/dosya hedefleri kapatılır
+        for hedef in hedefler:
+            hedef.kapat()
+        raise
@@ -0,0 +1,212 @@
+"""
+Akışlı Excel Yazıcı
+===================
+Ölçüm satırlarını arka planda, openpyxl'in write-only (sadece yazma)
+modunda Excel'e yazar.
+
+Eski yöntemde her kayıtta mevcut dosya pandas ile tamamen okunup yeniden
+yazılıyordu; büyük geçmişlerde bu dakikalar ve gigabaytlar sürer. Burada:
+- Mevcut dosyalar hiç okunmaz
+- Her oturum ve her gün için yeni bir dosya açılır
+  (aruco_mesafe_olcumleri_2024-01-01_120000.xlsx)
+- Bir sayfa Excel satır sınırına ulaşınca yeni sayfaya geçilir
+- Satırlar write-only modda geçici dosyaya akıtılır, bellek kullanımı
+  satır sayısından bağımsızdır
+- Yazma ayrı bir iş parçacığında yapılır, kamera döngüsü beklemez
+
+Kullanım:
+    yazici = ExcelAkisYazici("aruco_mesafe_olcumleri.xlsx")
+    yazici.ekle([{"tarih": "2024-01-01", "mesafe_cm": 12.3}])
+    yazici.yeni_dosya()    # Sonraki satırlar yeni dosyaya
+    yazici.kaydedilmemisleri_at()    # Açık dosyadaki satırları kaydetmeden at
+    yazici.kapat()
+"""
+
+import atexit
+import io
+import os
+import queue
+import threading
+from datetime import datetime
+
+from openpyxl import Workbook
+
+
+# Excel sayfa sınırı 1.048.576 satır (başlık satırı hariç)
+EXCEL_SATIR_SINIRI = 1048575
+
+# Kuyrukta "açık dosyayı kapat, sonraki satırları yeni dosyaya yaz" işareti
+YENI_DOSYA = object()
+
+# Kuyrukta "açık dosyayı kaydetmeden at" işareti
+KAYDEDILMEMISLERI_AT = object()
+
+
+class ExcelAkisYazici:
+    """
+    Satırları arka plan iş parçacığında write-only Excel dosyalarına akıtır.
+    """
+
+    def __init__(self, temel_yol, sutunlar=None, satir_siniri=EXCEL_SATIR_SINIRI):
+        """
+        ExcelAkisYazici sınıfını başlatır ve yazma iş parçacığını çalıştırır.
+
+        Parametreler:
+        -------------
+        temel_yol : str
+            Dosya adı şablonu; "olcumler.xlsx" -> "olcumler_<tarih>_<saat>.xlsx"
+        sutunlar : list veya None
+            Sütun sırası; None ise ilk satırın anahtarları kullanılır
+        satir_siniri : int
+            Bir sayfadaki en fazla veri satırı
+        """
+        self.temel_yol = temel_yol
+        self.sutunlar = sutunlar
+        self.satir_siniri = satir_siniri
+        self.oturum = datetime.now().strftime("%H%M%S")
+
+        # Yazma durumu (sadece iş parçacığı tarafından kullanılır)
+        self.kitap = None
+        self.sayfa = None
+        self.dosya_yolu = None
+        self.dosya_tarihi = None
+        self.sayfa_no = 0
+        self.sayfa_satir_sayisi = 0
+        self.yazilan_dosyalar = []
+
+        self.kuyruk = queue.Queue()
+        self.is_parcacigi = threading.Thread(target=self.calistir, name="ExcelAkisYazici", daemon=True)
+        self.is_parcacigi.start()
+
+        # Program kapatılmadan çıkılırsa bekleyen satırlar yine de yazılsın
+        atexit.register(self.kapat)
+
+    def ekle(self, satirlar):
+        """
+        Satırları yazma kuyruğuna ekler. Beklemeden döner.
+
+        Parametreler:
+        -------------
+        satirlar : list
+            Sütun adı -> değer sözlüklerinden oluşan liste
+        """
+        if self.is_parcacigi is None:
+            raise RuntimeError("Yazıcı kapatılmış")
+        self.kuyruk.put(list(satirlar))
+
+    def yeni_dosya(self):
+        """
+        Açık dosyanın kaydedilmesini kuyruğa ekler; sonraki satırlar yeni
+        bir dosyaya yazılır. Beklemeden döner.
+        """
+        if self.is_parcacigi is None:
+            raise RuntimeError("Yazıcı kapatılmış")
+        self.kuyruk.put(YENI_DOSYA)
+
+    def kaydedilmemisleri_at(self):
+        """
+        Açık (henüz diske kaydedilmemiş) dosyadaki satırları kaydetmeden atar;
+        sonraki satırlar yeni bir dosyaya yazılır. Daha önce kaydedilmiş
+        dosyalar (gün değişimi, yeni_dosya) etkilenmez. Beklemeden döner.
+        """
+        if self.is_parcacigi is None:
+            raise RuntimeError("Yazıcı kapatılmış")
+        self.kuyruk.put(KAYDEDILMEMISLERI_AT)
+
+    def kapat(self):
+        """
+        Kuyruktaki tüm satırların yazılmasını bekler ve açık dosyayı kaydeder.
+        """
+        if self.is_parcacigi is None:
+            return
+        self.kuyruk.put(None)
+        self.is_parcacigi.join()
+        self.is_parcacigi = None
+        atexit.unregister(self.kapat)
+
+    def calistir(self):
+        """Yazma iş parçacığının ana döngüsü."""
+        while True:
+            satirlar = self.kuyruk.get()
+            if satirlar is None:
+                break
+            if satirlar is YENI_DOSYA:
+                self.dosyayi_kapat()
+                continue
+            if satirlar is KAYDEDILMEMISLERI_AT:
+                self.dosyayi_at()
+                continue
+            try:
+                for satir in satirlar:
+                    self.satir_yaz(satir)
+            except Exception as hata:
+                print(f"⚠ Excel yazma hatası: {hata}")
+
+        self.dosyayi_kapat()
+
+    def satir_yaz(self, satir):
+        """Tek bir satırı gerekli dosya/sayfa geçişlerini yaparak yazar."""
+        if self.sutunlar is None:
+            self.sutunlar = list(satir.keys())
+
+        # Gün değişince yeni dosyaya geç
+        tarih = satir.get("tarih") or datetime.now().strftime("%Y-%m-%d")
+        if self.kitap is None or tarih != self.dosya_tarihi:
+            self.dosyayi_kapat()
+            self.dosya_ac(tarih)
+
+        # Sayfa dolunca yeni sayfaya geç
+        if self.sayfa_satir_sayisi >= self.satir_siniri:
+            self.sayfa_ac()
+
+        self.sayfa.append([satir.get(sutun) for sutun in self.sutunlar])
+        self.sayfa_satir_sayisi += 1
+
+    def dosya_ac(self, tarih):
+        """Verilen tarih için yeni bir write-only çalışma kitabı açar."""
+        kok, uzanti = os.path.splitext(self.temel_yol)
+        uzanti = uzanti or ".xlsx"
+        self.dosya_yolu = f"{kok}_{tarih}_{self.oturum}{uzanti}"
+
+        # Aynı oturumda yeni_dosya() ile açılan dosyalar numaralandırılır
+        sira = 2
+        while os.path.exists(self.dosya_yolu):
+            self.dosya_yolu = f"{kok}_{tarih}_{self.oturum}_{sira}{uzanti}"
+            sira += 1
+        self.dosya_tarihi = tarih
+        self.kitap = Workbook(write_only=True)
+        self.sayfa_no = 0
+        self.sayfa_ac()
+
+    def sayfa_ac(self):
+        """Kitaba başlık satırıyla yeni bir sayfa ekler."""
+        self.sayfa_no += 1
+        self.sayfa = self.kitap.create_sheet(f"olcumler_{self.sayfa_no}")
+        self.sayfa.append(self.sutunlar)
+        self.sayfa_satir_sayisi = 0
+
+    def dosyayi_kapat(self):
+        """Açık çalışma kitabını diske kaydeder."""
+        if self.kitap is None:
+            return
+        try:
+            self.kitap.save(self.dosya_yolu)
+            self.yazilan_dosyalar.append(self.dosya_yolu)
+            print(f"✓ Excel kaydedildi: {self.dosya_yolu}")
+        except Exception as hata:
+            print(f"⚠ Excel kaydedilemedi ({self.dosya_yolu}): {hata}")
+        self.kitap = None
+        self.sayfa = None
+
+    def dosyayi_at(self):
+        """Açık çalışma kitabını diske yazmadan bırakır."""
+        if self.kitap is None:
+            return
+        # Write-only sayfalar satırları geçici dosyalarda tutar; bellekteki
+        # bir arabelleğe kaydetmek bu dosyaları da temizler
+        try:
+            self.kitap.save(io.BytesIO())
+        except Exception as hata:
+            print(f"⚠ Excel geçici dosyaları temizlenemedi: {hata}")
+        self.kitap = None
+        self.sayfa = None
@@ -0,0 +1,157 @@
+"""
+OpenCV Hızlandırma Seçimi
+=========================
+Ön işleme (gri dönüşüm) ve marker tespitini iki farklı yoldan çalıştırabilir:
+
+- "numpy": Klasik yol, `np.ndarray` üzerinde (OpenCV'nin SIMD optimizasyonları ile)
+- "umat" : OpenCV T-API yolu, `cv2.UMat` üzerinde. OpenCL varsa (CPU veya GPU
+           OpenCL sürücüsü) işlemler OpenCL çekirdekleriyle çalışır.
+
+Hangi yolun ve kaç iş parçacığının daha hızlı olduğu makineye göre değişir.
+`arka_uc_sec()` başlangıçta kısa bir ölçüm yaparak en hızlısını seçer.
+OpenCL olmayan makinelerde her zaman "numpy" yoluna düşülür.
+
+Kullanım:
+    secim = arka_uc_sec(olcucu.detector, ornek_frame)
+    olcucu.arka_uc = secim["arka_uc"]
+"""
+
+import time
+
+import cv2
+import numpy as np
+
+
+def opencl_kullanilabilir():
+    """OpenCV'nin bu makinede OpenCL kullanıp kullanamayacağını döndürür."""
+    try:
+        return cv2.ocl.haveOpenCL()
+    except cv2.error:
+        return False
+
+
+def opencv_ayarla(arka_uc, is_parcacigi_sayisi=None):
+    """
+    OpenCV genel ayarlarını uygular.
+
+    Parametreler:
+    -------------
+    arka_uc : str
+        "numpy" veya "umat"
+    is_parcacigi_sayisi : int veya None
+        `cv2.setNumThreads` değeri, None ise dokunulmaz
+    """
+    # SIMD optimize edilmiş kod yollarını aç
+    cv2.setUseOptimized(True)
+
+    # OpenCL sadece UMat yolunda açık tutulur
+    if opencl_kullanilabilir():
+        cv2.ocl.setUseOpenCL(arka_uc == "umat")
+
+    if is_parcacigi_sayisi is not None:
+        cv2.setNumThreads(is_parcacigi_sayisi)
+
+
+def umat_ile_tespit(detector, frame):
+    """
+    Gri dönüşüm ve marker tespitini UMat üzerinde yapar.
+
+    Parametreler:
+    -------------
+    detector : cv2.aruco.ArucoDetector
+        Kullanılacak dedektör
+    frame : numpy.ndarray
+        BGR frame veya gri görüntü
+
+    Döndürür:
+    ---------
+    tuple
+        (koseler, idler, reddedilenler) - detectMarkers ile aynı, numpy dizileri olarak
+    """
+    u_frame = cv2.UMat(frame)
+    gri = u_frame if frame.ndim == 2 else cv2.cvtColor(u_frame, cv2.COLOR_BGR2GRAY)
+
+    koseler, idler, reddedilenler = detector.detectMarkers(gri)
+
+    # UMat girişinde çıktılar da UMat döner; ölçüm hesapları numpy ile yapılır
+    koseler = tuple(k.get() if isinstance(k, cv2.UMat) else k for k in koseler)
+    reddedilenler = tuple(r.get() if isinstance(r, cv2.UMat) else r for r in reddedilenler)
+    if isinstance(idler, cv2.UMat):
+        idler = idler.get()
+    if idler is not None and len(idler) == 0:
+        idler = None
+
+    return koseler, idler, reddedilenler
+
+
+def numpy_ile_tespit(detector, frame):
+    """Gri dönüşüm ve marker tespitini klasik numpy yolunda yapar."""
+    gri = frame if frame.ndim == 2 else cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    return detector.detectMarkers(gri)
+
+
+def sure_olc(fonksiyon, tekrar, isinma=2):
+    """Fonksiyonun medyan çalışma süresini (ms) döndürür."""
+    # İlk çağrılar OpenCL çekirdek derlemesi ve tampon ayırma içerir
+    for _ in range(isinma):
+        fonksiyon()
+
+    sureler = []
+    for _ in range(tekrar):
+        baslangic = time.perf_counter()
+        fonksiyon()
+        sureler.append((time.perf_counter() - baslangic) * 1000)
+    return float(np.median(sureler))
+
+
+def arka_uc_sec(detector, ornek_frame, tekrar=10):
+    """
+    Kısa bir ölçümle bu makinedeki en hızlı arka uç / iş parçacığı
+    kombinasyonunu seçer ve OpenCV'yi buna göre ayarlar.
+
+    Parametreler:
+    -------------
+    detector : cv2.aruco.ArucoDetector
+        Ölçümde kullanılacak dedektör
+    ornek_frame : numpy.ndarray
+        Kameradan alınmış örnek BGR frame
+    tekrar : int
+        Her kombinasyon için ölçülecek çalıştırma sayısı
+
+    Döndürür:
+    ---------
+    dict
+        arka_uc            : "numpy" veya "umat"
+        is_parcacigi_sayisi: Seçilen cv2.setNumThreads değeri
+        sureler_ms         : {(arka_uc, iş_parçacığı): medyan süre}
+    """
+    cpu_sayisi = cv2.getNumberOfCPUs()
+    is_parcacigi_adaylari = sorted({1, max(1, cpu_sayisi // 2), cpu_sayisi})
+
+    arka_uclar = ["numpy"]
+    if opencl_kullanilabilir():
+        arka_uclar.append("umat")
+
+    tespit_fonksiyonlari = {"numpy": numpy_ile_tespit, "umat": umat_ile_tespit}
+    sureler = {}
+
+    for arka_uc in arka_uclar:
+        for is_parcacigi in is_parcacigi_adaylari:
+            opencv_ayarla(arka_uc, is_parcacigi)
+            try:
+                sureler[(arka_uc, is_parcacigi)] = sure_olc(
+                    lambda: tespit_fonksiyonlari[arka_uc](detector, ornek_frame), tekrar
+                )
+            except cv2.error as hata:
+                # OpenCL sürücüsü hatalıysa bu yol elenir
+                print(f"⚠ {arka_uc} yolu kullanılamıyor: {hata}")
+                break
+
+    arka_uc, is_parcacigi = min(sureler, key=sureler.get)
+    opencv_ayarla(arka_uc, is_parcacigi)
+
+    return {
+        "arka_uc": arka_uc,
+        "is_parcacigi_sayisi": is_parcacigi,
+        "sureler_ms": sureler,
+    }
@@ -0,0 +1,168 @@
+"""
+Kare Tampon Havuzu
+==================
+Kamera okumaları için önceden ayrılmış (preallocated) frame tamponları sağlar.
+
+Normalde her `cap.read()` çağrısı yeni bir numpy dizisi ayırır. 1080p ve
+30 fps'de bu saniyede yüzlerce MB bellek ayırma/serbest bırakma demektir.
+Bu modül sabit sayıda tamponu sırayla (round-robin) kullanarak okumaları
+doğrudan bu dizilere yaptırır: `cap.read(image=tampon)`.
+
+Okuma `grab()` + `retrieve()` olarak iki adımda yapılır; yakalama zamanı
+`grab()` anında alınır, böylece çözme (decode) süresi gecikmeye dahil olur.
+
+Kullanım:
+    havuz = KareTamponHavuzu(tampon_sayisi=2)
+    ret, frame = havuz.oku(cap)
+    ret, frame, zaman = havuz.zamanli_oku(cap)
+"""
+
+import time
+
+import cv2
+import numpy as np
+
+
+class KareTamponHavuzu:
+    """
+    Kamera frame'leri için sabit boyutlu, döngüsel tampon havuzu.
+
+    Tamponlar ilk başarılı okumada kameranın gerçek çözünürlüğüne göre
+    ayrılır. Kamera farklı boyutta bir frame döndürürse (çözünürlük
+    değişimi) ilgili tampon yenisiyle değiştirilir.
+    """
+
+    def __init__(self, tampon_sayisi=2):
+        """
+        KareTamponHavuzu sınıfını başlatır.
+
+        Parametreler:
+        -------------
+        tampon_sayisi : int
+            Döngüde kullanılacak tampon sayısı. Bir frame işlenirken bir
+            sonrakinin okunabilmesi için en az 2 olmalıdır.
+        """
+        if tampon_sayisi < 1:
+            raise ValueError("tampon_sayisi en az 1 olmalı")
+
+        self.tampon_sayisi = tampon_sayisi
+        self.tamponlar = [None] * tampon_sayisi
+        self.sira = 0
+
+        # İstatistik: tampon dışına yapılan (yeni) ayırma sayısı
+        self.yeniden_ayirma_sayisi = 0
+
+    def siradaki_tampon(self):
+        """
+        Sıradaki tamponu döndürür ve sırayı bir ilerletir.
+
+        Döndürür:
+        ---------
+        tuple
+            (indeks, tampon) - tampon henüz ayrılmamışsa None
+        """
+        indeks = self.sira
+        self.sira = (self.sira + 1) % self.tampon_sayisi
+        return indeks, self.tamponlar[indeks]
+
+    def oku(self, cap):
+        """
+        Kameradan bir frame'i sıradaki tampona okur.
+
+        Parametreler:
+        -------------
+        cap : cv2.VideoCapture
+            Açık video kaynağı
+
+        Döndürür:
+        ---------
+        tuple
+            (ret, frame) - `cap.read()` ile aynı biçimde
+        """
+        ret, frame, _ = self.zamanli_oku(cap)
+        return ret, frame
+
+    def zamanli_oku(self, cap):
+        """
+        Kameradan bir frame'i sıradaki tampona okur ve yakalama zamanını döndürür.
+
+        Parametreler:
+        -------------
+        cap : cv2.VideoCapture
+            Açık video kaynağı
+
+        Döndürür:
+        ---------
+        tuple
+            (ret, frame, yakalama_zamani) - zaman bilgisi için `yakalama_zamani_al()`
+        """
+        indeks, tampon = self.siradaki_tampon()
+
+        if not cap.grab():
+            return False, None, None
+        zaman = yakalama_zamani_al(cap)
+
+        ret, frame = cap.retrieve(image=tampon)
+        if not ret or frame is None:
+            return False, None, None
+
+        # OpenCV boyut/tip uyuşmazlığında yeni dizi ayırır; onu havuza al
+        if frame is not tampon:
+            self.tamponlar[indeks] = frame
+            self.yeniden_ayirma_sayisi += 1
+
+        return True, frame, zaman
+
+
+def yakalama_zamani_al(cap=None):
+    """
+    Frame'in yakalandığı anın zaman bilgisini oluşturur.
+
+    Parametreler:
+    -------------
+    cap : cv2.VideoCapture veya None
+        Verilirse kaynağın kendi zamanı (`CAP_PROP_POS_MSEC`) da okunur
+
+    Döndürür:
+    ---------
+    dict
+        monotonik_ns     : `time.monotonic_ns()` - gecikme hesabı için (saat ayarından etkilenmez)
+        zaman_damgasi_ns : Unix zamanı (ns) - diğer sensörlerle eşleştirmek için
+        kaynak_ms        : Video/kamera zamanı (ms), kaynak desteklemiyorsa None
+    """
+    zaman = {
+        "monotonik_ns": time.monotonic_ns(),
+        "zaman_damgasi_ns": time.time_ns(),
+        "kaynak_ms": None,
+    }
+
+    if cap is not None:
+        kaynak_ms = cap.get(cv2.CAP_PROP_POS_MSEC)
+        # Desteklemeyen kaynaklar 0 veya -1 döndürür
+        if kaynak_ms > 0:
+            zaman["kaynak_ms"] = kaynak_ms
+
+    return zaman
+
+
+def gri_tampona_cevir(frame, gri_tampon):
+    """
+    BGR frame'i verilen gri tampona dönüştürür, gerekirse tamponu yeniden ayırır.
+
+    Parametreler:
+    -------------
+    frame : numpy.ndarray
+        BGR formatında frame
+    gri_tampon : numpy.ndarray veya None
+        Tekrar kullanılacak tek kanallı tampon
+
+    Döndürür:
+    ---------
+    numpy.ndarray
+        Gri görüntü (mümkünse `gri_tampon` ile aynı dizi)
+    """
+    hedef_sekil = frame.shape[:2]
+    if gri_tampon is None or gri_tampon.shape != hedef_sekil:
+        gri_tampon = np.empty(hedef_sekil, dtype=np.uint8)
+
+    return cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=gri_tampon)
@@ -0,0 +1,134 @@
+"""
+Kare Tampon Havuzu Karşılaştırması
+==================================
+Klasik okuma yolu ile tampon havuzu yolunu karşılaştırır:
+
+- Klasik: `cap.read()` + `cv2.cvtColor()` + panel için `frame.copy()`
+- Havuz:  `KareTamponHavuzu.oku()` + gri tampona dönüşüm + panelin yerinde karıştırılması
+
+Kamera gerekmez; geçici bir MJPG video dosyası oluşturulup kaynak olarak kullanılır.
+
+Ölçülenler:
+- Frame başına ayrılan bellek (tracemalloc ile izlenen numpy ayırmaları)
+- Frame başına süre: ortalama, standart sapma (jitter), p99
+
+Kullanım:
+    python kare_tampon_havuzu_benchmark.py
+"""
+
+import os
+import tempfile
+import time
+import tracemalloc
+
+import cv2
+import numpy as np
+
+from kare_tampon_havuzu import KareTamponHavuzu, gri_tampona_cevir
+
+
+GENISLIK = 1920
+YUKSEKLIK = 1080
+KARE_SAYISI = 150
+
+
+def ornek_video_olustur(yol, kare_sayisi=KARE_SAYISI):
+    """Üzerinde iki ArUco marker bulunan geçici bir test videosu yazar."""
+    aruco_dict = cv2.aruco.getPredefinedDictionary(cv2.aruco.DICT_4X4_250)
+    marker1 = cv2.cvtColor(cv2.aruco.generateImageMarker(aruco_dict, 1, 200), cv2.COLOR_GRAY2BGR)
+    marker2 = cv2.cvtColor(cv2.aruco.generateImageMarker(aruco_dict, 2, 200), cv2.COLOR_GRAY2BGR)
+
+    yazici = cv2.VideoWriter(yol, cv2.VideoWriter_fourcc(*"MJPG"), 30, (GENISLIK, YUKSEKLIK))
+    for i in range(kare_sayisi):
+        frame = np.full((YUKSEKLIK, GENISLIK, 3), 255, dtype=np.uint8)
+        x = 300 + (i % 50) * 4
+        frame[400:600, x:x + 200] = marker1
+        frame[400:600, x + 800:x + 1000] = marker2
+        yazici.write(frame)
+    yazici.release()
+
+
+def klasik_adim(cap, durum):
+    ret, frame = cap.read()
+    if not ret:
+        return False
+    durum["gri"] = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+    overlay = frame.copy()
+    cv2.rectangle(overlay, (10, 10), (350, 150), (0, 0, 0), -1)
+    cv2.addWeighted(overlay, 0.7, frame, 0.3, 0, frame)
+    return True
+
+
+def havuz_adim(cap, durum):
+    ret, frame = durum["havuz"].oku(cap)
+    if not ret:
+        return False
+    durum["gri"] = gri_tampona_cevir(frame, durum["gri"])
+    panel = frame[10:176, 10:351]
+    cv2.addWeighted(panel, 0.3, panel, 0, 0, panel)
+    return True
+
+
+def calistir(video_yolu, adim, bellek_olc):
+    """
+    Bir yolu video sonuna kadar çalıştırır.
+
+    Döndürür:
+    ---------
+    tuple
+        (süreler_ms, frame_başına_ayrılan_bayt)
+    """
+    cap = cv2.VideoCapture(video_yolu)
+    durum = {"havuz": KareTamponHavuzu(tampon_sayisi=2), "gri": None}
+    sureler = []
+    ayrilan = []
+
+    if bellek_olc:
+        tracemalloc.start()
+
+    while True:
+        if bellek_olc:
+            onceki, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+
+        baslangic = time.perf_counter()
+        if not adim(cap, durum):
+            break
+        sureler.append((time.perf_counter() - baslangic) * 1000)
+
+        if bellek_olc:
+            _, tepe = tracemalloc.get_traced_memory()
+            ayrilan.append(tepe - onceki)
+
+    if bellek_olc:
+        tracemalloc.stop()
+    cap.release()
+
+    # İlk frame'ler ısınma (tampon ayırma) içerir, dahil edilmez
+    return np.array(sureler[5:]), np.array(ayrilan[5:])
+
+
+def main():
+    print("=" * 50)
+    print("   KARE TAMPON HAVUZU KARŞILAŞTIRMASI")
+    print("=" * 50)
+    print(f"Çözünürlük: {GENISLIK}x{YUKSEKLIK}, {KARE_SAYISI} frame")
+
+    with tempfile.TemporaryDirectory() as klasor:
+        video_yolu = os.path.join(klasor, "ornek.avi")
+        ornek_video_olustur(video_yolu)
+
+        for ad, adim in (("Klasik", klasik_adim), ("Havuz", havuz_adim)):
+            _, ayrilan = calistir(video_yolu, adim, bellek_olc=True)
+            sureler, _ = calistir(video_yolu, adim, bellek_olc=False)
+
+            mb_frame = ayrilan.mean() / 1e6
+            print(f"\n--- {ad} ---")
+            print(f"  Ayrılan bellek : {mb_frame:8.2f} MB/frame ({mb_frame * 30:.0f} MB/s @30fps)")
+            print(f"  Süre ortalama  : {sureler.mean():8.2f} ms")
+            print(f"  Jitter (std)   : {sureler.std():8.2f} ms")
+            print(f"  p99            : {np.percentile(sureler, 99):8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
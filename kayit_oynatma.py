@@ -0,0 +1,405 @@
+"""
+Ölçüm Kaydı ve Tekrar Oynatma
+==============================
+Kamera frame'lerini, tespit edilen marker köşelerini, zaman damgalarını ve
+ölçücü yapılandırmasını tek bir indeksli dosyaya (.amk) kaydeder. Kaydedilen
+dosya daha sonra `ArucoMesafeOlcucu.olcum_yap()` (frame_isle'nin ölçüm
+çekirdeği) üzerinden gerçek zamandan hızlı şekilde tekrar oynatılabilir.
+
+Amaç: Hatalı görünen bir ölçümü birebir tekrar üretebilmek ve frame indeksine
+göre rastgele erişimle (seek) regresyonları hızlıca daraltmak (bisect).
+
+Dosya yapısı:
+    [MAGIC][yapılandırma uzunluğu][yapılandırma JSON]
+    [kayıt 1][kayıt 2]...[kayıt N]
+    [indeks: N x uint64 ofset, N x float64 zaman_ms][son ek]
+
+    kayıt   = başlık + kodlanmış frame + marker ID'leri (int32) + köşeler (float32)
+    son ek  = indeks ofseti, kare sayısı, MAGIC
+
+Program kapanmadan kesilirse son ek yazılmaz; okuyucu bu durumda indeksi
+kayıtları baştan tarayarak yeniden oluşturur.
+
+Kullanım:
+    python kayit_oynatma.py kayitlar/aruco_kayit_20240101_120000.amk
+    python kayit_oynatma.py kayit.amk --baslangic 100 --bitis 200
+"""
+
+import argparse
+import json
+import os
+import struct
+import time
+
+import cv2
+import numpy as np
+
+
+MAGIC = b"AMKAYIT1"
+
+# zaman_ms, kare_bayt, marker_sayisi, yukseklik, genislik, kanal
+KAYIT_BASLIGI = struct.Struct("<dIIHHH")
+
+# indeks_ofseti, kare_sayisi, MAGIC
+SON_EK = struct.Struct("<QQ8s")
+
+SIKISTIRMA_UZANTILARI = {"jpg": ".jpg", "png": ".png"}
+
+
+class KayitYazici:
+    """
+    Frame ve tespitleri indeksli .amk dosyasına yazar.
+    """
+
+    def __init__(self, yol, yapilandirma=None, sikistirma="jpg", jpeg_kalitesi=95):
+        """
+        KayitYazici sınıfını başlatır ve dosya başlığını yazar.
+
+        Parametreler:
+        -------------
+        yol : str
+            Oluşturulacak kayıt dosyası
+        yapilandirma : dict
+            Ölçücü ayarları (tekrar oynatmada aynı ölçücüyü kurmak için)
+        sikistirma : str
+            "jpg" (küçük dosya), "png" (kayıpsız) veya "ham" (sıkıştırmasız)
+        jpeg_kalitesi : int
+            JPEG kalite değeri (0-100)
+        """
+        if sikistirma not in ("jpg", "png", "ham"):
+            raise ValueError(f"Bilinmeyen sıkıştırma: {sikistirma}")
+
+        self.yol = yol
+        self.sikistirma = sikistirma
+        self.jpeg_kalitesi = jpeg_kalitesi
+
+        self.ofsetler = []
+        self.zamanlar = []
+
+        klasor = os.path.dirname(yol)
+        if klasor:
+            os.makedirs(klasor, exist_ok=True)
+
+        yapilandirma = dict(yapilandirma or {})
+        yapilandirma["sikistirma"] = sikistirma
+        baslik = json.dumps(yapilandirma, ensure_ascii=False).encode("utf-8")
+
+        self.dosya = open(yol, "wb")
+        self.dosya.write(MAGIC)
+        self.dosya.write(struct.pack("<I", len(baslik)))
+        self.dosya.write(baslik)
+
+    def kare_kodla(self, frame):
+        """Frame'i seçilen sıkıştırma ile bayt dizisine çevirir."""
+        if self.sikistirma == "ham":
+            return np.ascontiguousarray(frame).tobytes()
+
+        parametreler = []
+        if self.sikistirma == "jpg":
+            parametreler = [cv2.IMWRITE_JPEG_QUALITY, self.jpeg_kalitesi]
+
+        basarili, kodlanmis = cv2.imencode(SIKISTIRMA_UZANTILARI[self.sikistirma], frame, parametreler)
+        if not basarili:
+            raise RuntimeError("Frame kodlanamadı")
+        return kodlanmis.tobytes()
+
+    def kare_ekle(self, frame, zaman_ms, idler=None, koseler=None):
+        """
+        Bir frame'i ve tespitlerini dosyaya ekler.
+
+        Parametreler:
+        -------------
+        frame : numpy.ndarray
+            Çizim yapılmamış (ham) BGR frame
+        zaman_ms : float
+            Frame zaman damgası (milisaniye)
+        idler : list veya numpy.ndarray
+            Tespit edilen marker ID'leri
+        koseler : list veya numpy.ndarray
+            Her marker için (4, 2) köşe koordinatları
+        """
+        kare_bayt = self.kare_kodla(frame)
+
+        idler = np.asarray(idler if idler is not None else [], dtype=np.int32).reshape(-1)
+        koseler = np.asarray(koseler if koseler is not None and len(koseler) else np.empty((0, 4, 2)),
+                             dtype=np.float32).reshape(-1, 4, 2)
+
+        yukseklik, genislik = frame.shape[:2]
+        kanal = frame.shape[2] if frame.ndim == 3 else 1
+
+        self.ofsetler.append(self.dosya.tell())
+        self.zamanlar.append(zaman_ms)
+
+        self.dosya.write(KAYIT_BASLIGI.pack(zaman_ms, len(kare_bayt), len(idler),
+                                            yukseklik, genislik, kanal))
+        self.dosya.write(kare_bayt)
+        self.dosya.write(idler.tobytes())
+        self.dosya.write(koseler.tobytes())
+
+    def kapat(self):
+        """İndeksi ve son eki yazarak dosyayı kapatır."""
+        if self.dosya is None:
+            return
+
+        indeks_ofseti = self.dosya.tell()
+        self.dosya.write(np.asarray(self.ofsetler, dtype=np.uint64).tobytes())
+        self.dosya.write(np.asarray(self.zamanlar, dtype=np.float64).tobytes())
+        self.dosya.write(SON_EK.pack(indeks_ofseti, len(self.ofsetler), MAGIC))
+        self.dosya.close()
+        self.dosya = None
+
+        print(f"✓ {len(self.ofsetler)} frame kaydedildi: {self.yol}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.kapat()
+
+
+class KayitOkuyucu:
+    """
+    .amk kayıt dosyasını okur. Frame'lere indeks ile rastgele erişim sağlar.
+    """
+
+    def __init__(self, yol):
+        """
+        Kayıt dosyasını açar, yapılandırmayı ve indeksi yükler.
+
+        Parametreler:
+        -------------
+        yol : str
+            Okunacak kayıt dosyası
+        """
+        self.yol = yol
+        self.dosya = open(yol, "rb")
+
+        if self.dosya.read(len(MAGIC)) != MAGIC:
+            self.dosya.close()
+            raise ValueError(f"Geçerli bir kayıt dosyası değil: {yol}")
+
+        (baslik_uzunlugu,) = struct.unpack("<I", self.dosya.read(4))
+        self.yapilandirma = json.loads(self.dosya.read(baslik_uzunlugu).decode("utf-8"))
+        self.sikistirma = self.yapilandirma.get("sikistirma", "jpg")
+        self.veri_baslangici = self.dosya.tell()
+
+        self.ofsetler, self.zamanlar = self.indeksi_yukle()
+
+    def indeksi_yukle(self):
+        """
+        Son ekteki indeksi okur. Son ek yoksa (yarım kalmış kayıt)
+        kayıtları baştan tarayarak indeksi yeniden oluşturur.
+        """
+        dosya_boyutu = os.fstat(self.dosya.fileno()).st_size
+
+        if dosya_boyutu - self.veri_baslangici >= SON_EK.size:
+            self.dosya.seek(dosya_boyutu - SON_EK.size)
+            indeks_ofseti, kare_sayisi, magic = SON_EK.unpack(self.dosya.read(SON_EK.size))
+
+            if magic == MAGIC:
+                self.dosya.seek(indeks_ofseti)
+                ofsetler = np.frombuffer(self.dosya.read(8 * kare_sayisi), dtype=np.uint64)
+                zamanlar = np.frombuffer(self.dosya.read(8 * kare_sayisi), dtype=np.float64)
+                return ofsetler, zamanlar
+
+        return self.indeksi_tara(dosya_boyutu)
+
+    def indeksi_tara(self, dosya_boyutu):
+        """Kayıtları sırayla okuyarak indeksi oluşturur."""
+        ofsetler = []
+        zamanlar = []
+        ofset = self.veri_baslangici
+
+        while ofset + KAYIT_BASLIGI.size <= dosya_boyutu:
+            self.dosya.seek(ofset)
+            zaman_ms, kare_bayt, marker_sayisi, _, _, _ = KAYIT_BASLIGI.unpack(
+                self.dosya.read(KAYIT_BASLIGI.size))
+            kayit_sonu = ofset + KAYIT_BASLIGI.size + kare_bayt + marker_sayisi * (4 + 32)
+
+            # Yarım yazılmış son kayıt atlanır
+            if kayit_sonu > dosya_boyutu:
+                break
+
+            ofsetler.append(ofset)
+            zamanlar.append(zaman_ms)
+            ofset = kayit_sonu
+
+        print(f"⚠ Kayıt düzgün kapatılmamış, {len(ofsetler)} frame kurtarıldı: {self.yol}")
+        return np.asarray(ofsetler, dtype=np.uint64), np.asarray(zamanlar, dtype=np.float64)
+
+    def __len__(self):
+        return len(self.ofsetler)
+
+    def kare_oku(self, indeks):
+        """
+        Verilen indeksteki frame'i ve kayıtlı tespitleri okur.
+
+        Parametreler:
+        -------------
+        indeks : int
+            Frame indeksi (negatif indeks sondan sayar)
+
+        Döndürür:
+        ---------
+        dict
+            {"indeks", "zaman_ms", "frame", "idler", "koseler"}
+        """
+        if indeks < 0:
+            indeks += len(self)
+        if not 0 <= indeks < len(self):
+            raise IndexError(f"Frame indeksi aralık dışında: {indeks}")
+
+        self.dosya.seek(int(self.ofsetler[indeks]))
+        zaman_ms, kare_bayt, marker_sayisi, yukseklik, genislik, kanal = KAYIT_BASLIGI.unpack(
+            self.dosya.read(KAYIT_BASLIGI.size))
+
+        veri = self.dosya.read(kare_bayt)
+        if self.sikistirma == "ham":
+            sekil = (yukseklik, genislik, kanal) if kanal > 1 else (yukseklik, genislik)
+            frame = np.frombuffer(veri, dtype=np.uint8).reshape(sekil).copy()
+        else:
+            frame = cv2.imdecode(np.frombuffer(veri, dtype=np.uint8), cv2.IMREAD_UNCHANGED)
+
+        idler = np.frombuffer(self.dosya.read(4 * marker_sayisi), dtype=np.int32)
+        koseler = np.frombuffer(self.dosya.read(32 * marker_sayisi), dtype=np.float32).reshape(-1, 4, 2)
+
+        return {
+            "indeks": indeks,
+            "zaman_ms": zaman_ms,
+            "frame": frame,
+            "idler": idler,
+            "koseler": koseler,
+        }
+
+    def __getitem__(self, indeks):
+        return self.kare_oku(indeks)
+
+    def __iter__(self):
+        for indeks in range(len(self)):
+            yield self.kare_oku(indeks)
+
+    def kapat(self):
+        self.dosya.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.kapat()
+
+
+def kose_sapmasi_hesapla(kayitli_idler, kayitli_koseler, idler, koseler):
+    """
+    Kayıtlı ve yeniden tespit edilen köşeler arasındaki en büyük sapmayı bulur.
+    Sadece her iki tarafta da bulunan ID'ler karşılaştırılır.
+
+    Döndürür:
+    ---------
+    float veya None
+        Piksel cinsinden en büyük köşe sapması, ortak marker yoksa None
+    """
+    kayitli = {int(i): k for i, k in zip(kayitli_idler, kayitli_koseler)}
+    sapmalar = [
+        np.abs(np.asarray(k, dtype=np.float32) - kayitli[int(i)]).max()
+        for i, k in zip(idler, koseler)
+        if int(i) in kayitli
+    ]
+    return float(max(sapmalar)) if sapmalar else None
+
+
+def kaydi_oynat(okuyucu, olcucu=None, baslangic=0, bitis=None, adim=1, ayar_farkina_izin_ver=False):
+    """
+    Kayıtlı frame'leri ölçücüden geçirir. Bekleme ve çizim yapılmaz, yani
+    kayıt işlemcinin izin verdiği en yüksek hızda oynatılır.
+
+    Parametreler:
+    -------------
+    okuyucu : KayitOkuyucu
+        Açık kayıt dosyası
+    olcucu : ArucoMesafeOlcucu veya None
+        None ise kayıttaki yapılandırmadan (sözlük ve dedektör parametreleri
+        dahil) yeni bir ölçücü oluşturulur
+    baslangic, bitis, adim : int
+        Oynatılacak frame aralığı (range ile aynı anlam)
+    ayar_farkina_izin_ver : bool
+        Verilen ölçücünün ayarları kayıttakilerden farklıysa varsayılan olarak
+        ValueError verilir; True ise (ör. yeni parametreleri eski kayıtla
+        denerken) fark yok sayılır
+
+    Döndürür:
+    ---------
+    generator
+        Her frame için {"indeks", "zaman_ms", "mesafe_cm", "olcum", "kose_sapmasi_px"}
+    """
+    kayit_ayarlari = okuyucu.yapilandirma
+    if olcucu is None:
+        # Döngüsel içe aktarmayı önlemek için burada içe aktarılır
+        from aruco_mesafe_olcumu import DEDEKTOR_AYARLARI, ArucoMesafeOlcucu
+        olcucu = ArucoMesafeOlcucu(
+            marker_boyutu_cm=kayit_ayarlari.get("marker_boyutu_cm", 5.0),
+            referans_tahta=kayit_ayarlari.get("referans_tahta"),
+            kalite_esigi=kayit_ayarlari.get("kalite_esigi", 0.5),
+            sozluk=kayit_ayarlari.get("sozluk", "DICT_4X4_250"),
+            dedektor_ayarlari={ad: kayit_ayarlari[ad] for ad in DEDEKTOR_AYARLARI
+                               if ad in kayit_ayarlari}
+        )
+
+    # Kayıttaki ayarlarla oynatılmayan kayıt aynı sonucu vermez
+    farklar = {ad: (kayit_ayarlari[ad], deger) for ad, deger in olcucu.yapilandirma().items()
+               if ad in kayit_ayarlari and kayit_ayarlari[ad] != deger}
+    if farklar and not ayar_farkina_izin_ver:
+        raise ValueError(f"Ölçücü ayarları kayıttan farklı (kayıt, ölçücü): {farklar}")
+
+    if bitis is None:
+        bitis = len(okuyucu)
+
+    for indeks in range(baslangic, bitis, adim):
+        kayit = okuyucu.kare_oku(indeks)
+        olcum = olcucu.olcum_yap(kayit["frame"])
+
+        yield {
+            "indeks": indeks,
+            "zaman_ms": kayit["zaman_ms"],
+            "mesafe_cm": olcum["mesafe_cm"],
+            "olcum": olcum,
+            "kose_sapmasi_px": kose_sapmasi_hesapla(
+                kayit["idler"], kayit["koseler"],
+                olcum["idler"], olcum["koseler"]
+            ),
+        }
+
+
+def main():
+    """Kayıt dosyasını oynatır ve frame başına ölçümleri yazdırır."""
+    ayristirici = argparse.ArgumentParser(description="ArUco ölçüm kaydını tekrar oynatır.")
+    ayristirici.add_argument("yol", help="Kayıt dosyası (.amk)")
+    ayristirici.add_argument("--baslangic", type=int, default=0, help="İlk frame indeksi")
+    ayristirici.add_argument("--bitis", type=int, default=None, help="Son frame indeksi (hariç)")
+    ayristirici.add_argument("--adim", type=int, default=1, help="Frame atlama adımı")
+    argumanlar = ayristirici.parse_args()
+
+    with KayitOkuyucu(argumanlar.yol) as okuyucu:
+        print(f"Kayıt: {argumanlar.yol}")
+        print(f"Frame sayısı: {len(okuyucu)}")
+        print(f"Yapılandırma: {okuyucu.yapilandirma}")
+        print("-" * 50)
+
+        islenen = 0
+        baslangic_zamani = time.perf_counter()
+
+        for sonuc in kaydi_oynat(okuyucu, baslangic=argumanlar.baslangic,
+                                 bitis=argumanlar.bitis, adim=argumanlar.adim):
+            mesafe = f"{sonuc['mesafe_cm']:.2f} cm" if sonuc["mesafe_cm"] is not None else "-"
+            sapma = f"{sonuc['kose_sapmasi_px']:.2f} px" if sonuc["kose_sapmasi_px"] is not None else "-"
+            print(f"[{sonuc['indeks']:6d}] {sonuc['zaman_ms']:10.1f} ms  "
+                  f"ID: {sonuc['olcum']['idler'].tolist()}  mesafe: {mesafe}  köşe sapması: {sapma}")
+            islenen += 1
+
+        gecen = time.perf_counter() - baslangic_zamani
+        if islenen:
+            print("-" * 50)
+            print(f"✓ {islenen} frame {gecen:.2f} s içinde oynatıldı ({islenen / gecen:.1f} fps)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,11 @@
 import cv2
 import numpy as np
-import pandas as pd
 from datetime import datetime
 import os
 import math
 
+from excel_akis_yazici import ExcelAkisYazici
+
 
 class ReferansNesneMesafeOlcucu:
     
@@ -23,8 +24,8 @@ class ReferansNesneMesafeOlcucu:
         self.mevcut_frame = None
         self.gosterim_frame = None
         
-        # Ölçüm kayıtları
-        self.olcum_kayitlari = []
+        # Bu seride kaydedilen ölçüm sayısı (satırlar bellekte tutulmaz)
+        self.kayit_sayisi = 0
         
         # Son ölçülen mesafe
         self.son_mesafe = None
@@ -34,6 +35,9 @@ class ReferansNesneMesafeOlcucu:
             os.path.dirname(__file__), 
             "referans_mesafe_olcumleri.xlsx"
         )
+        
+        # Akışlı Excel yazıcısı (excel_ac ile veya ilk kayıtta oluşturulur)
+        self.excel_yazici = None
     
     def fare_callback(self, event, x, y, flags, param):
 
@@ -225,7 +229,7 @@ class ReferansNesneMesafeOlcucu:
                        (20, y), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (200, 200, 200), 1)
         
         y += 25
-        cv2.putText(frame, f"Kayit Sayisi: {len(self.olcum_kayitlari)}", 
+        cv2.putText(frame, f"Kayit Sayisi: {self.kayit_sayisi}", 
                    (20, y), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 1)
         
         y += 30
@@ -252,37 +256,28 @@ class ReferansNesneMesafeOlcucu:
             "mesafe_cm": round(self.son_mesafe, 2),
             "piksel_cm_orani": round(self.piksel_cm_orani, 4) if self.piksel_cm_orani else None
         }
-        self.olcum_kayitlari.append(kayit)
+        self.excel_ac()
+        self.excel_yazici.ekle([kayit])
+        self.kayit_sayisi += 1
         print(f"✓ Ölçüm kaydedildi: {self.son_mesafe:.2f} cm")
         return kayit
     
-    def excel_kaydet(self):
-        if not self.olcum_kayitlari:
-            print("⚠ Kaydedilecek ölçüm yok!")
-            return
-        
-        yeni_df = pd.DataFrame(self.olcum_kayitlari)
-        
-        # Mevcut dosya varsa birleştir
-        if os.path.exists(self.excel_dosyasi):
-            try:
-                mevcut_df = pd.read_excel(self.excel_dosyasi)
-                df = pd.concat([mevcut_df, yeni_df], ignore_index=True)
-            except:
-                df = yeni_df
-        else:
-            df = yeni_df
-        
-        # Excel'e kaydet
-        df.to_excel(self.excel_dosyasi, index=False, engine='openpyxl')
-        print(f"✓ {len(self.olcum_kayitlari)} ölçüm Excel'e kaydedildi: {self.excel_dosyasi}")
-        
-        # Listeyi temizle
-        self.olcum_kayitlari = []
+    def excel_ac(self):
+        """Akışlı Excel yazıcısını başlatır; kayıtlar geldikçe arka planda yazılır."""
+        if self.excel_yazici is None:
+            self.excel_yazici = ExcelAkisYazici(self.excel_dosyasi)
+    
+    def excel_kapat(self):
+        """Kuyruktaki ölçümlerin yazılmasını bekler ve Excel dosyasını kapatır."""
+        if self.excel_yazici is not None:
+            self.excel_yazici.kapat()
+            self.excel_yazici = None
     
     def kayitlari_sifirla(self):
         """Kaydedilmemiş ölçümleri ve seçimleri siler."""
-        self.olcum_kayitlari = []
+        self.kayit_sayisi = 0
+        if self.excel_yazici is not None:
+            self.excel_yazici.kaydedilmemisleri_at()
         self.secili_noktalar = []
         self.son_mesafe = None
         print("✓ Kayıtlar ve seçimler sıfırlandı")
@@ -306,6 +301,9 @@ def main():
     cv2.namedWindow(pencere_adi)
     cv2.setMouseCallback(pencere_adi, olcucu.fare_callback)
     
+    # Ölçümler 's' ile kaydedildikleri anda arka planda Excel'e yazılır
+    olcucu.excel_ac()
+    
     while True:
         ret, frame = cap.read()
         if not ret:
@@ -322,8 +320,6 @@ def main():
         key = cv2.waitKey(1) & 0xFF
         
         if key == ord('q'):
-            # Çıkışta Excel'e kaydet
-            olcucu.excel_kaydet()
             break
             
         elif key == ord('c'):
@@ -361,6 +357,9 @@ def main():
     # Temizlik
     cap.release()
     cv2.destroyAllWindows()
+    
+    # Kuyruktaki ölçümlerin yazılmasını bekle
+    olcucu.excel_kapat()
     print("\nProgram sonlandırıldı.")
 
 
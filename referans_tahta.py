@@ -0,0 +1,155 @@
+"""
+ArUco Referans Tahtası
+======================
+Piksel/cm oranını tek bir marker yerine bilinen geometrideki bir ArUco
+GridBoard'dan hesaplar.
+
+Tek marker'da ölçek sadece 4 köşeden gelir; birkaç piksellik köşe gürültüsü
+uzak mesafede santimetre düzeyinde hataya dönüşür. Tahtada görünen tüm
+marker köşeleri (ör. 12 marker = 48 nokta) tek bir en küçük kareler
+uydurmasında kullanılır, böylece her frame'de daha hassas ölçek elde edilir.
+
+Tahta markerları ölçüm markerlarından ayrı bir ID aralığı kullanır
+(varsayılan: 100'den başlar), ölçüm markerları 0-99 arasında kalır.
+
+Kullanım:
+    python referans_tahta.py    # Yazdırılabilir tahta görüntüsü oluşturur
+"""
+
+import os
+
+import cv2
+import numpy as np
+
+
+VARSAYILAN_TAHTA = {
+    "sutun": 4,
+    "satir": 3,
+    "marker_boyutu_cm": 4.0,
+    "bosluk_cm": 1.0,
+    "ilk_id": 100,
+}
+
+
+def tahta_olustur(aruco_dict, sutun=4, satir=3, marker_boyutu_cm=4.0, bosluk_cm=1.0, ilk_id=100):
+    """
+    Ölçüleri cm cinsinden olan bir ArUco GridBoard oluşturur.
+
+    Parametreler:
+    -------------
+    aruco_dict : cv2.aruco.Dictionary
+        Ölçücüyle aynı sözlük
+    sutun, satir : int
+        Tahtadaki marker sayısı (yatay, dikey)
+    marker_boyutu_cm : float
+        Tahtadaki her marker'ın kenar uzunluğu
+    bosluk_cm : float
+        Markerlar arası boşluk
+    ilk_id : int
+        Tahtanın ilk marker ID'si; sonraki ID'ler sırayla artar
+
+    Döndürür:
+    ---------
+    cv2.aruco.GridBoard
+    """
+    idler = np.arange(ilk_id, ilk_id + sutun * satir, dtype=np.int32)
+    return cv2.aruco.GridBoard((sutun, satir), marker_boyutu_cm, bosluk_cm, aruco_dict, idler)
+
+
+def tahta_olcegi_hesapla(tahta, koseler, idler):
+    """
+    Görünen tüm tahta köşelerinden piksel/cm oranını en küçük kareler ile hesaplar.
+
+    Görüntü noktaları ile tahta noktaları arasında benzerlik dönüşümü
+    (ölçek + dönme + öteleme) uydurulur. Noktalar karmaşık sayı olarak
+    yazıldığında bu, tek bir kapalı formüllü doğrusal en küçük kareler
+    problemidir:
+
+        goruntu = a * tahta + b      (a, b karmaşık)
+        |a| = piksel/cm oranı
+
+    Parametreler:
+    -------------
+    tahta : cv2.aruco.GridBoard
+        Referans tahtası
+    koseler : numpy.ndarray
+        (N, 4, 2) tahta markerlarının köşeleri
+    idler : numpy.ndarray
+        (N,) tahta markerlarının ID'leri
+
+    Döndürür:
+    ---------
+    tuple
+        (piksel_cm_orani, ortalama_karesel_hata_px, nokta_sayisi)
+        Tahta markerı yoksa (None, None, 0)
+    """
+    if len(idler) == 0:
+        return None, None, 0
+
+    nesne_noktalari, goruntu_noktalari = tahta.matchImagePoints(
+        list(koseler[:, None]), idler.reshape(-1, 1)
+    )
+    if nesne_noktalari is None or len(nesne_noktalari) < 2:
+        return None, None, 0
+
+    z_tahta = nesne_noktalari[:, 0, 0] + 1j * nesne_noktalari[:, 0, 1]
+    z_goruntu = goruntu_noktalari[:, 0, 0] + 1j * goruntu_noktalari[:, 0, 1]
+
+    # Ağırlık merkezlerine göre ortalanınca öteleme (b) düşer
+    z_tahta = z_tahta - z_tahta.mean()
+    z_goruntu = z_goruntu - z_goruntu.mean()
+
+    a = np.vdot(z_tahta, z_goruntu) / np.vdot(z_tahta, z_tahta).real
+    artiklar = z_goruntu - a * z_tahta
+    hata_px = float(np.sqrt(np.mean(np.abs(artiklar) ** 2)))
+
+    return float(np.abs(a)), hata_px, len(z_tahta)
+
+
+def tahta_goruntusu_kaydet(tahta, yol, piksel_cm=50, kenar_bosluk_px=40):
+    """
+    Tahtayı yazdırılabilir bir görüntü olarak kaydeder.
+
+    Parametreler:
+    -------------
+    tahta : cv2.aruco.GridBoard
+        Kaydedilecek tahta
+    yol : str
+        Çıktı dosyası (.png)
+    piksel_cm : int
+        Görüntü çözünürlüğü (1 cm kaç piksel)
+    kenar_bosluk_px : int
+        Tahta etrafındaki beyaz kenar
+    """
+    sutun, satir = tahta.getGridSize()
+    marker = tahta.getMarkerLength()
+    bosluk = tahta.getMarkerSeparation()
+
+    genislik = int(round((sutun * marker + (sutun - 1) * bosluk) * piksel_cm)) + 2 * kenar_bosluk_px
+    yukseklik = int(round((satir * marker + (satir - 1) * bosluk) * piksel_cm)) + 2 * kenar_bosluk_px
+
+    goruntu = tahta.generateImage((genislik, yukseklik), marginSize=kenar_bosluk_px)
+
+    klasor = os.path.dirname(yol)
+    if klasor:
+        os.makedirs(klasor, exist_ok=True)
+    cv2.imwrite(yol, goruntu)
+    print(f"✓ Referans tahta kaydedildi: {yol}")
+
+
+def main():
+    """Varsayılan referans tahtasının yazdırılabilir görüntüsünü oluşturur."""
+    aruco_dict = cv2.aruco.getPredefinedDictionary(cv2.aruco.DICT_4X4_250)
+    tahta = tahta_olustur(aruco_dict, **VARSAYILAN_TAHTA)
+
+    yol = os.path.join(os.path.dirname(__file__), "markers", "referans_tahta.png")
+    tahta_goruntusu_kaydet(tahta, yol)
+
+    print(f"  {VARSAYILAN_TAHTA['sutun']}x{VARSAYILAN_TAHTA['satir']} marker, "
+          f"marker: {VARSAYILAN_TAHTA['marker_boyutu_cm']} cm, "
+          f"boşluk: {VARSAYILAN_TAHTA['bosluk_cm']} cm")
+    print("  Yazdırdıktan sonra marker boyutunu cetvelle kontrol edin!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+"""
+Tespit Kalitesi
+===============
+Her ArUco tespiti için 0-1 arası bir kalite puanı hesaplar ve kısa bir
+frame penceresi içindeki en iyi ölçümü seçer.
+
+Hareket bulanıklığı olan frame'ler, çok eğik duran markerlar veya kare
+olmayan köşe dörtgenleri aykırı mesafeler üretir. Bu modül bu tespitleri
+ölçüme girmeden eler.
+
+Puan bileşenleri (hepsi 0-1, çarpılarak birleştirilir):
+- kenar_orani   : En kısa kenar / en uzun kenar (kare = 1)
+- kosegen_orani : Kısa köşegen / uzun köşegen (kare = 1)
+- alan_puani    : Marker alanı / en küçük güvenilir alan (1 ile sınırlı)
+- netlik_puani  : Sabit boyuta ölçeklenmiş marker bölgesinde Laplacian varyansı /
+                  parlaklık varyansı oranı r için p / (1 + p), p = (r / netlik_olcegi)^4
+                  (marker boyutundan ve aydınlatmadan bağımsız)
+"""
+
+from collections import deque
+
+import cv2
+import numpy as np
+
+
+def geometri_puanlari(koseler, alan_min_px=400.0):
+    """
+    Köşe dörtgenlerinden geometri puanlarını vektörel olarak hesaplar.
+
+    Parametreler:
+    -------------
+    koseler : numpy.ndarray
+        (N, 4, 2) marker köşeleri
+    alan_min_px : float
+        Bu alanın (piksel²) altındaki markerların puanı orantılı düşer
+
+    Döndürür:
+    ---------
+    dict
+        kenar_orani, kosegen_orani, alan_px, alan_puani - her biri (N,)
+    """
+    koseler = np.asarray(koseler, dtype=np.float32).reshape(-1, 4, 2)
+    sonraki = np.roll(koseler, -1, axis=1)
+
+    kenarlar = np.linalg.norm(sonraki - koseler, axis=2)
+    kenar_orani = kenarlar.min(axis=1) / np.maximum(kenarlar.max(axis=1), 1e-6)
+
+    kosegenler = np.stack([
+        np.linalg.norm(koseler[:, 2] - koseler[:, 0], axis=1),
+        np.linalg.norm(koseler[:, 3] - koseler[:, 1], axis=1),
+    ], axis=1)
+    kosegen_orani = kosegenler.min(axis=1) / np.maximum(kosegenler.max(axis=1), 1e-6)
+
+    # Shoelace (ayakkabı bağı) formülü ile dörtgen alanı
+    capraz = koseler[:, :, 0] * sonraki[:, :, 1] - sonraki[:, :, 0] * koseler[:, :, 1]
+    alan_px = 0.5 * np.abs(capraz.sum(axis=1))
+    alan_puani = np.clip(alan_px / alan_min_px, 0.0, 1.0)
+
+    return {
+        "kenar_orani": kenar_orani,
+        "kosegen_orani": kosegen_orani,
+        "alan_px": alan_px,
+        "alan_puani": alan_puani,
+    }
+
+
+def netlik_puanlari(goruntu, koseler, netlik_olcegi=0.03, olcek_boyutu=64, kenar_payi_orani=0.15):
+    """
+    Her marker'ın netliğini, boyuttan ve aydınlatmadan bağımsız olarak ölçer.
+
+    Ham Laplacian varyansı kontrastın karesiyle büyür ve marker piksel olarak
+    büyüdükçe düşer; yani bulanıklık yerine ışığı ve mesafeyi ölçer. Bu yüzden:
+    - Marker bölgesi sabit boyuta (olcek_boyutu x olcek_boyutu) ölçeklenir,
+      bulanıklık marker boyutuna göre değerlendirilir
+    - Hafif sabit bir Gauss süzgeci örnekleme hizası ve gürültü etkisini bastırır
+    - Laplacian varyansı bölgenin parlaklık varyansına bölünür (kontrast²)
+
+    Parametreler:
+    -------------
+    goruntu : numpy.ndarray
+        BGR veya gri görüntü
+    koseler : numpy.ndarray
+        (N, 4, 2) marker köşeleri
+    netlik_olcegi : float
+        Puanın 0.5 olduğu normalize Laplacian oranı. Net markerlarda oran
+        ~0.05-0.10, marker boyutunun ~%3'ü kadar bulanıklıkta ~0.03'tür
+    olcek_boyutu : int
+        Bölgenin ölçeklendiği kenar uzunluğu (piksel)
+    kenar_payi_orani : float
+        Köşelerin dışında alınan pay (marker boyutuna oranla)
+
+    Döndürür:
+    ---------
+    numpy.ndarray
+        (N,) netlik puanları
+    """
+    yukseklik, genislik = goruntu.shape[:2]
+    puanlar = np.ones(len(koseler), dtype=np.float32)
+
+    for i, kose in enumerate(koseler):
+        # Dış kenarın tamamı bölgede kalsın diye köşelerin biraz dışı da alınır
+        kenar_payi = kenar_payi_orani * np.ptp(kose, axis=0).max()
+        x1, y1 = np.floor(kose.min(axis=0) - kenar_payi).astype(int)
+        x2, y2 = np.ceil(kose.max(axis=0) + kenar_payi).astype(int)
+        x1, y1 = max(x1, 0), max(y1, 0)
+        x2, y2 = min(x2 + 1, genislik), min(y2 + 1, yukseklik)
+        if x2 - x1 < 3 or y2 - y1 < 3:
+            puanlar[i] = 0.0
+            continue
+
+        # Sadece küçük bölge griye çevrilir, tüm frame değil
+        bolge = goruntu[y1:y2, x1:x2]
+        if bolge.ndim == 3:
+            bolge = cv2.cvtColor(bolge, cv2.COLOR_BGR2GRAY)
+
+        # Sabit boyuta ölçekle; küçültmede INTER_AREA örtüşmeyi (aliasing) önler
+        ara_deger = cv2.INTER_AREA if max(bolge.shape) > olcek_boyutu else cv2.INTER_LINEAR
+        bolge = cv2.resize(bolge, (olcek_boyutu, olcek_boyutu), interpolation=ara_deger)
+        bolge = cv2.GaussianBlur(bolge.astype(np.float32), (0, 0), 0.8)
+
+        parlaklik_varyansi = float(bolge.var())
+        if parlaklik_varyansi < 1e-6:
+            puanlar[i] = 0.0
+            continue
+
+        oran = cv2.Laplacian(bolge, cv2.CV_32F).var() / parlaklik_varyansi
+
+        # Dik geçiş: net markerlar ~1, belirgin bulanıklık hızla 0'a iner
+        p = (oran / netlik_olcegi) ** 4
+        puanlar[i] = p / (1.0 + p)
+
+    return puanlar
+
+
+def kalite_puanlari(koseler, goruntu=None, alan_min_px=400.0, netlik_olcegi=0.03):
+    """
+    Tüm markerlar için birleşik kalite puanını hesaplar.
+
+    Parametreler:
+    -------------
+    koseler : numpy.ndarray
+        (N, 4, 2) marker köşeleri
+    goruntu : numpy.ndarray veya None
+        Netlik ölçümü için görüntü; None ise netlik 1 kabul edilir
+
+    Döndürür:
+    ---------
+    numpy.ndarray
+        (N,) 0-1 arası kalite puanları
+    """
+    if len(koseler) == 0:
+        return np.empty(0, dtype=np.float32)
+
+    puanlar = geometri_puanlari(koseler, alan_min_px)
+    kalite = puanlar["kenar_orani"] * puanlar["kosegen_orani"] * puanlar["alan_puani"]
+
+    if goruntu is not None:
+        kalite = kalite * netlik_puanlari(goruntu, koseler, netlik_olcegi)
+
+    return kalite.astype(np.float32)
+
+
+class EnIyiOlcumSecici:
+    """
+    Son N frame içindeki en yüksek kaliteli ölçümü tutar.
+
+    Her frame için `ekle()` çağrılır (ölçüm yoksa None ile), böylece pencere
+    zamanla kayar ve eski ölçümler kendiliğinden düşer.
+    """
+
+    def __init__(self, pencere=15):
+        """
+        Parametreler:
+        -------------
+        pencere : int
+            Karşılaştırılacak son frame sayısı (30 fps'de 15 frame = 0.5 s)
+        """
+        self.pencere = deque(maxlen=pencere)
+
+    def ekle(self, olcum, kalite=None):
+        """
+        Bir frame'in ölçümünü pencereye ekler.
+
+        Parametreler:
+        -------------
+        olcum : dict veya None
+            Kaydedilecek ölçüm bilgileri, bu frame'de ölçüm yoksa None
+        kalite : float
+            Ölçümün kalite puanı
+        """
+        self.pencere.append(None if olcum is None else (kalite, olcum))
+
+    def en_iyi(self):
+        """
+        Penceredeki en yüksek kaliteli ölçümü döndürür.
+
+        Döndürür:
+        ---------
+        tuple veya None
+            (kalite, olcum), pencerede ölçüm yoksa None
+        """
+        adaylar = [aday for aday in self.pencere if aday is not None]
+        if not adaylar:
+            return None
+        return max(adaylar, key=lambda aday: aday[0])
+
+    def temizle(self):
+        self.pencere.clear()